@@ -0,0 +1 @@
+# Make the utils, src and ux_ui packages importable from the tests, as they are from the notebooks
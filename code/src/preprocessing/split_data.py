@@ -53,7 +53,7 @@ def plot_discrepancies(matrix_df):
     plt.xticks(rotation=45)
     plt.show()
 
-def split_wells_by_prediction(data, curves_to_predict, min_curves=5, random_seed=None):
+def split_wells_by_prediction(data, curves_to_predict, min_curves=5, random_seed=None, candidate_wells=None):
     """
     Classifies wells into training/validation and external test sets using random split and K-Fold approach,
     based on whether they have the target curves (curves_to_predict) and meet the minimum number of curves.
@@ -63,6 +63,8 @@ def split_wells_by_prediction(data, curves_to_predict, min_curves=5, random_seed
     - curves_to_predict: List of target curves to predict (e.g., CNLS, RHOC).
     - min_curves: Minimum number of curves a well must have to be included.
     - random_seed: Random seed to ensure reproducibility.
+    - candidate_wells: Optional wells pre-selected from the LAS catalog (e.g. the lease column of
+      ProjectManager.get_wells_by_curves(curves_to_predict)); other wells are discarded without inspecting their data.
 
     Returns:
     - train_validation_data: Wells assigned to the training/validation set for K-Fold cross-validation.
@@ -80,6 +82,9 @@ def split_wells_by_prediction(data, curves_to_predict, min_curves=5, random_seed
 
     # Filter wells that have the minimum number of curves and the target curves
     for well, df in data.items():
+        if candidate_wells is not None and well not in candidate_wells:
+            discarded_wells.append(well)
+            continue
         available_curves = df.columns.tolist()
         if len(available_curves) >= min_curves and all(curve in available_curves for curve in curves_to_predict):
             filtered_data[well] = df
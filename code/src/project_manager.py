@@ -21,7 +21,7 @@ import numpy as np
 from scipy import stats
 from sklearn.ensemble import IsolationForest
 from sklearn.cluster import DBSCAN
-from collections import Counter
+from collections import Counter, OrderedDict
 import numpy as np
 import copy 
 from multiprocessing import Pool, cpu_count
@@ -30,6 +30,35 @@ from sklearn.cluster import DBSCAN
 from scipy import stats
 from sklearn.neighbors import LocalOutlierFactor
 from pandas.api.types import is_any_real_numeric_dtype
+from utils.las_reader import read_las, read_las_header
+from utils.las_inventory import scan_las_inventory, query_catalog, catalog_path, parse_formation_tops
+import json
+import pickle
+import multiprocessing
+import queue
+import functools
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from welly.las import from_lasio as welly_datasets_from_lasio
+from utils.field_store import read_curve_slice, write_field_store
+
+# Seconds a single LAS file may take to load before its worker process is terminated
+LAS_LOAD_TIMEOUT = 10
+
+# Start of the load errors of files that timed out, retried on the next load instead of being quarantined
+TIMEOUT_ERROR_PREFIX = 'Timeout:'
+
+# Per-field list of LAS files that failed to load, skipped on later loads until they change
+QUARANTINE_FILENAME = 'quarantine.json'
+
+# Per-field folder of .npz caches of the parsed wells, read instead of the LAS file while it is unchanged
+WELL_CACHE_FOLDER = '.well_cache'
+
+# Format version of the well caches, caches of another version are parsed again
+WELL_CACHE_VERSION = 1
+
+# Data file of the field store, written in WELL_CACHE_FOLDER next to its offset table
+FIELD_STORE_FILENAME = 'field_store.bin'
 
 # region LASIO Supress stdout
 # SuppressOutput context manager
@@ -49,8 +78,399 @@ class SuppressOutput:
         sys.stderr = self.original_stderr
 # endregion
 
+# region Isolated LAS loading
+def build_formation_intervals(formations, start_depth, stop_depth):
+    """
+    Turns the formation tops of a well into contiguous intervals for well logging plots.
+
+    A missing base depth is filled with the top of the next formation, or the stop depth of
+    the well for the last one, and an 'Unknown' layer covers the well above the first top.
+
+    Args:
+        formations (list): {'formation', 'top', 'base'} dicts sorted by top, see parse_formation_tops.
+        start_depth (float): STRT of the well.
+        stop_depth (float): STOP of the well.
+
+    Returns:
+        list: [(top_depth, base_depth, formation_name), ...] sorted by top depth.
+    """
+    intervals = []
+    for i, formation in enumerate(formations):
+        if formation['base'] is not None:
+            base_depth = formation['base']
+        elif i < len(formations) - 1:
+            base_depth = formations[i + 1]['top']
+        else:
+            base_depth = stop_depth
+        intervals.append((formation['top'], base_depth, formation['formation']))
+
+    # Add top layer if necessary
+    if formations and formations[0]['top'] > start_depth:
+        intervals.insert(0, (start_depth, formations[0]['top'], 'Unknown'))
+
+    intervals.sort(key=lambda x: x[0])
+    return intervals
+
+def load_well_payload(las_file, header_only=False):
+    """
+    Parses a LAS file with the fast ~A reader into the compact form sent back by the workers:
+    the welly header table, the curve table as a single 2D array with its column names, and
+    the formation intervals of the ~Other section, all from the same parse. With header_only
+    the file is read up to its ~A line and the payload has no curve data.
+    """
+    las = read_las_header(las_file) if header_only else read_las(las_file)
+    datasets = welly_datasets_from_lasio(las)
+    curves = datasets['Curves']
+    start_depth = las.well['STRT'].value if 'STRT' in las.well else None
+    stop_depth = las.well['STOP'].value if 'STOP' in las.well else None
+    payload = {
+        'header': datasets['Header'],
+        'columns': list(curves.columns),
+        'formation_intervals': build_formation_intervals(parse_formation_tops(las.other), start_depth, stop_depth),
+    }
+    if header_only:
+        return payload
+    if all(np.issubdtype(dtype, np.floating) for dtype in curves.dtypes):
+        payload['data'] = curves.to_numpy(dtype=np.float64)
+    else:
+        payload['curves'] = curves
+    return payload
+
+def well_from_payload(payload, las_file):
+    """Builds the welly Well of a worker payload, equivalent to welly.Well.from_las(las_file)."""
+    curves = payload.get('curves')
+    if curves is None:
+        curves = pd.DataFrame(payload['data'], columns=payload['columns'], copy=False)
+    return welly.Well.from_datasets({'Curves': curves, 'Header': payload['header']}, data=True, fname=las_file)
+
+def frame_from_payload(payload):
+    """
+    Builds the depth-indexed curve table of a payload, the table well.df() returns, without
+    building the welly Well. The float curves are a view of the payload array.
+    """
+    curves = payload.get('curves')
+    if curves is None:
+        curves = pd.DataFrame(payload['data'], columns=payload['columns'], copy=False)
+    return curves.set_index(payload['columns'][0])
+
+def well_cache_path(las_file):
+    """Path of the .npz cache of a LAS file, in the WELL_CACHE_FOLDER of its field."""
+    folder, file_name = os.path.split(las_file)
+    return os.path.join(folder, WELL_CACHE_FOLDER, os.path.splitext(file_name)[0] + '.npz')
+
+def json_default(value):
+    """Converts the NumPy scalars of welly's header table for json.dumps."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def save_well_cache(payload, las_file, signature):
+    """
+    Writes the payload of a LAS file to its .npz cache atomically: the curve array and its
+    column names, plus the header table, formation intervals and signature of the LAS file
+    as JSON. Payloads with non-numeric curves are not cached.
+
+    Args:
+        payload (dict): Payload of the LAS file, see load_well_payload.
+        las_file (str): Path to the LAS file.
+        signature (list): [size, mtime_ns] of the LAS file when it was parsed.
+    """
+    if 'data' not in payload:
+        return
+    path = well_cache_path(las_file)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    meta = {
+        'version': WELL_CACHE_VERSION,
+        'signature': signature,
+        'header': payload['header'].to_dict(orient='split'),
+        'formation_intervals': payload['formation_intervals'],
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, data=payload['data'], columns=np.array(payload['columns'], dtype=str), meta=np.array(json.dumps(meta, default=json_default)))
+    os.replace(tmp_path, path)
+
+def load_well_cache(las_file, signature, with_data=True):
+    """
+    Reads the payload of a LAS file from its .npz cache.
+
+    Args:
+        las_file (str): Path to the LAS file.
+        signature (list): Current [size, mtime_ns] of the LAS file.
+        with_data (bool): Read the curve array, only the header, columns and formation
+            intervals are read if False.
+
+    Returns:
+        dict: The payload, see load_well_payload, or None if there is no cache, it is
+            unreadable or the LAS file changed since it was written.
+    """
+    try:
+        with np.load(well_cache_path(las_file), allow_pickle=False) as cache:
+            meta = json.loads(cache['meta'].item())
+            if meta['version'] != WELL_CACHE_VERSION or meta['signature'] != signature:
+                return None
+            header = meta['header']
+            payload = {
+                'header': pd.DataFrame(header['data'], index=header['index'], columns=header['columns']),
+                'columns': cache['columns'].tolist(),
+                'formation_intervals': [tuple(interval) for interval in meta['formation_intervals']],
+            }
+            if with_data:
+                payload['data'] = cache['data']
+            return payload
+    except (OSError, ValueError, KeyError):
+        return None
+
+def well_object_cache_path(las_file):
+    """Path of the pickled welly Well of a LAS file, next to its .npz cache."""
+    return os.path.splitext(well_cache_path(las_file))[0] + '.well.pkl'
+
+def save_well_object_cache(well, las_file, signature):
+    """
+    Pickles a freshly built welly Well atomically, so a warm eager load does not build it
+    again from its payload.
+
+    Args:
+        well (welly.Well): The Well, before any change made by the project.
+        las_file (str): Path to the LAS file.
+        signature (list): [size, mtime_ns] of the LAS file the Well was built from.
+    """
+    path = well_object_cache_path(las_file)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump((WELL_CACHE_VERSION, signature, well), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+def load_well_object_cache(las_file, signature):
+    """
+    Reads the pickled welly Well of a LAS file.
+
+    Returns:
+        welly.Well: The Well, or None if there is no cache, it is unreadable (e.g. written by
+            another welly version) or the LAS file changed since it was written.
+    """
+    try:
+        with open(well_object_cache_path(las_file), 'rb') as f:
+            version, cached_signature, well = pickle.load(f)
+    except Exception:
+        return None
+    if version != WELL_CACHE_VERSION or cached_signature != signature:
+        return None
+    return well
+
+def las_load_worker(connection):
+    """
+    Worker process loop: parses each (LAS file path, cache signature, header only) received and
+    sends back (payload, error). The payload is also written to the well cache when a signature
+    is given. A None request stops the worker.
+    """
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        las_file, cache_signature, header_only = request
+        try:
+            with SuppressOutput():
+                payload = load_well_payload(las_file, header_only)
+            if cache_signature is not None and not header_only:
+                try:
+                    save_well_cache(payload, las_file, cache_signature)
+                except OSError:
+                    pass
+            connection.send((payload, None))
+        except Exception as e:
+            connection.send((None, f"{type(e).__name__}: {e}"))
+
+class IsolatedWellLoader:
+    """
+    Parses LAS files one at a time in a separate worker process, so a file that hangs or
+    crashes the parser only costs its own timeout. The worker is restarted after a failure.
+    Several loaders driven by threads parse a field in parallel.
+    """
+    def __init__(self, timeout=LAS_LOAD_TIMEOUT):
+        self.timeout = timeout
+        self.process = None
+        self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=las_load_worker, args=(worker_connection,), daemon=True)
+        self.process.start()
+        worker_connection.close()
+
+    def stop(self, terminate=False):
+        if self.process is None:
+            return
+        if not terminate:
+            try:
+                self.connection.send(None)
+                self.process.join(self.timeout)
+            except OSError:
+                pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+        self.process = None
+        self.connection = None
+
+    def load(self, las_file, cache_signature=None, header_only=False):
+        """
+        Parses one LAS file in the worker process.
+
+        Args:
+            las_file (str): Path to the LAS file.
+            cache_signature (list): [size, mtime_ns] of the LAS file, to write its well cache.
+            header_only (bool): Parse only the header sections, see load_well_payload.
+
+        Returns:
+            tuple: (payload, error), see load_well_payload. payload is None and error describes
+                the failure if the file could not be loaded.
+        """
+        if self.process is None:
+            self.start()
+        self.connection.send((las_file, cache_signature, header_only))
+
+        # Terminate a worker stuck on the file
+        if not self.connection.poll(self.timeout):
+            self.stop(terminate=True)
+            return None, f"{TIMEOUT_ERROR_PREFIX} not loaded after {self.timeout} s"
+        try:
+            return self.connection.recv()
+        except (EOFError, OSError):
+            self.stop(terminate=True)
+            return None, "Worker process crashed while loading the file"
+# endregion
+
+# region Lazy wells
+class WellLoadError(ValueError):
+    """Raised when the curve data of a LazyWell cannot be loaded, see load_lazy_well."""
+
+class LazyCurves(MutableMapping):
+    """
+    The data mapping of a LazyWell: lists, tests and deletes curve names without loading the
+    well, and loads it on the first access to a curve.
+    """
+    def __init__(self, lazy_well, curve_names):
+        self.lazy_well = lazy_well
+        self.curve_names = list(curve_names)
+
+    def __getitem__(self, curve_name):
+        return self.lazy_well.load().data[curve_name]
+
+    def __setitem__(self, curve_name, curve):
+        self.lazy_well.load().data[curve_name] = curve
+        if curve_name not in self.curve_names:
+            self.curve_names.append(curve_name)
+
+    def __delitem__(self, curve_name):
+        self.curve_names.remove(curve_name)
+        if self.lazy_well.well is not None:
+            del self.lazy_well.well.data[curve_name]
+
+    def __iter__(self):
+        return iter(list(self.curve_names))
+
+    def __len__(self):
+        return len(self.curve_names)
+
+    def __contains__(self, curve_name):
+        return curve_name in self.curve_names
+
+class LazyWell:
+    """
+    Stands in for a welly Well whose header and curve names are known but whose ~A section is
+    not parsed yet. header, fname and the curve names of data are available up front, the
+    welly Well and the depth-indexed curve table (frame) are built by the loader on the first
+    access to a curve or any other attribute, and kept until unload.
+    """
+    def __init__(self, las_file, header, columns, loader, on_use=None):
+        """
+        Args:
+            las_file (str): Path to the LAS file.
+            header (pd.DataFrame): The welly header table of the well.
+            columns (list): Depth index and curve mnemonics, see load_well_payload.
+            loader (callable): Called with the LazyWell, returns its payload with curve data.
+            on_use (callable): Called with the LazyWell on every access to its data.
+        """
+        self.fname = las_file
+        self.header = header
+        self.loader = loader
+        self.on_use = on_use
+        self.well = None
+        self.frame = None
+        self.data = LazyCurves(self, columns[1:])
+
+    def load(self):
+        """Builds the welly Well from the loader's payload on the first call, returns it."""
+        if self.well is None:
+            payload = self.loader(self)
+            well = well_from_payload(payload, self.fname)
+            # Curves deleted before the well was loaded stay deleted
+            for curve_name in list(well.data):
+                if curve_name not in self.data:
+                    del well.data[curve_name]
+            self.frame = frame_from_payload(payload)
+            self.well = well
+        if self.on_use is not None:
+            self.on_use(self)
+        return self.well
+
+    def unload(self):
+        """Drops the curve data, the loader is called again on the next access."""
+        self.well = None
+        self.frame = None
+
+    @property
+    def is_loaded(self):
+        return self.well is not None
+
+    @property
+    def nbytes(self):
+        """Bytes held by the curve data: the curve table, whose arrays the welly curves share, and the curve indexes."""
+        if self.well is None:
+            return 0
+        return int(self.frame.memory_usage(index=True).sum()) + sum(curve.df.index.nbytes for curve in self.well.data.values())
+
+    def __reduce_ex__(self, protocol):
+        # Pickled (e.g. for a worker process) as the loaded welly Well, without the loader
+        return pickle.loads, (pickle.dumps(self.load(), protocol),)
+
+    def __getattr__(self, name):
+        # Only called for attributes LazyWell does not define, which belong to the welly Well
+        if name.startswith('__') or name in ('well', 'frame', 'data', 'loader', 'on_use'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+def estimate_nbytes(data):
+    """
+    Estimates the memory held by some data: arrays and pandas objects by their buffers, dicts
+    and sequences recursively, and sequences of numbers (e.g. outlier indices) by their length.
+    """
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True).sum())
+    if isinstance(data, (pd.Series, pd.Index)):
+        return int(data.memory_usage(index=True) if isinstance(data, pd.Series) else data.memory_usage())
+    if isinstance(data, dict):
+        return sys.getsizeof(data) + sum(estimate_nbytes(key) + estimate_nbytes(value) for key, value in data.items())
+    if isinstance(data, (list, tuple, set)):
+        if data and isinstance(next(iter(data)), (int, float)):
+            return sys.getsizeof(data) + len(data) * sys.getsizeof(next(iter(data)))
+        return sys.getsizeof(data) + sum(estimate_nbytes(item) for item in data)
+    return sys.getsizeof(data)
+# endregion
+
 class ProjectManager:
-    def __init__(self, base_directory):
+    def __init__(self, base_directory, memory_budget_mb=None):
         self.base_directory = base_directory
         self.fields = self.load_fields()
         self.selected_field = None
@@ -66,6 +486,16 @@ class ProjectManager:
         self.outliers = {}
         self.prepared_data = {}  
         self.unique_formations = set()  # New attribute to store unique formations
+        self.load_errors = {}  # LAS files skipped by the last load, with their error
+        self.well_frames = {}  # Depth-indexed curve table of each well, by lease name
+        self.field_store = None  # Memory-mapped curves of the loaded wells, see build_field_store
+        self.well_index = {}  # Well of the project by lease name, see build_well_index
+        self.well_leases = {}  # Lease name of each well of the project, by id(well)
+        self.lazy_loader = None  # Worker process loading the curves of lazy wells, see load_lazy_well
+        self.load_timeout = LAS_LOAD_TIMEOUT  # Seconds a LAS file may take to load, see load_selected_field
+        self.memory_budget_mb = memory_budget_mb  # Memory the project may hold, see enforce_memory_budget
+        self.well_lru = OrderedDict()  # Loaded lazy wells by id(well), least recently used first
+        self.components = {}  # Data held by other components, e.g. the missingno UI, see register_component
 
     # region path_las_file_list
     def las_file_list(self):
@@ -86,37 +516,303 @@ class ProjectManager:
     # region Load ans Select field
     ########## --- ipwidget - load_and_select_field / widgets.py --- ##########
     def load_fields(self):
-        return [name for name in os.listdir(self.base_directory) if os.path.isdir(os.path.join(self.base_directory, name))]
+        """
+        Lists the field folders of the base directory.
 
-    def load_selected_field(self, progress_callback=None):
+        The folders, not the LAS catalog, decide which fields exist, so fields without LAS files
+        or added since the last catalog scan are listed too.
+        """
+        return sorted(name for name in os.listdir(self.base_directory) if os.path.isdir(os.path.join(self.base_directory, name)))
+
+    def load_selected_field(self, progress_callback=None, max_workers=None, use_cache=True, build_wells=True, lazy=False, timeout=LAS_LOAD_TIMEOUT):
         """
         Loads wells for the selected field into a Welly Project and extracts formation data.
-        
+
+        The files are parsed in parallel by max_workers isolated worker processes, each with a
+        timeout of timeout seconds per file, and sent back as compact curve arrays plus
+        header tables. Files that fail are skipped, recorded in load_errors and in the
+        field's quarantine list, so they are skipped without parsing on later loads until
+        they change or clear_quarantine is called. Files that only timed out are not
+        quarantined and are parsed again on the next load.
+
+        With use_cache, each parsed well is also written to an .npz cache in the field's
+        WELL_CACHE_FOLDER, and wells whose LAS file has the same size and mtime as when
+        cached are read from it without starting any worker. The welly Wells built by an
+        eager load are pickled next to it, so a warm eager load does not build them again. The curve table of every well
+        is kept in well_frames, which detect_all_outliers and prepare_data use directly, so
+        with build_wells=False a cached field loads without building any welly object.
+
+        With lazy, only the header sections are read (from the cache when it is valid) and
+        the project holds LazyWell objects: headers, curve names and formation data are
+        available at once, and the ~A section of a well is loaded by load_lazy_well the
+        first time one of its curves is used. Fields are always loaded lazily when a memory
+        budget is set, so that the curve data of the least recently used wells can be unloaded.
+
+        Args:
+            progress_callback (callable): Called with (files done, total files) as files complete.
+            max_workers (int): Number of worker processes, the number of CPUs by default.
+            use_cache (bool): Read and write the well caches.
+            build_wells (bool): Build the welly Project, only the curve tables are loaded if False.
+            lazy (bool): Defer the curve data of each well to its first use.
+            timeout (float): Seconds a LAS file may take to load, also used by load_lazy_well.
+
         Returns:
-            project: A Welly Project object containing the loaded wells.
+            project: A Welly Project object containing the loaded wells, None if not build_wells.
         """
         if not self.selected_field:
             raise ValueError("No field selected. Please set the selected_field attribute.")
         
         las_files = self.las_file_list()
+        quarantine = self.load_quarantine()
+        signatures = {las_file: self.get_file_signature(las_file) for las_file in las_files}
+        self.load_errors = {}
+        self.well_frames = {}
+        self.field_store = None
+        self.well_index = {}
+        self.well_leases = {}
+        if self.lazy_loader is not None:
+            self.lazy_loader.stop()
+            self.lazy_loader = None
+        self.well_lru = OrderedDict()
+        self.components = {}
+        self.load_timeout = timeout
+        lazy = lazy or self.memory_budget_mb is not None
+
+        # Skip files that already failed, unless they changed since or only timed out
+        pending = []
+        for las_file in las_files:
+            file_name = os.path.basename(las_file)
+            record = quarantine.get(file_name)
+            if record and [record['size'], record['mtime_ns']] == signatures[las_file] and not record['error'].startswith(TIMEOUT_ERROR_PREFIX):
+                self.load_errors[las_file] = record['error']
+            else:
+                quarantine.pop(file_name, None)
+                pending.append(las_file)
+
+        done = len(las_files) - len(pending)
+        if progress_callback and done:
+            progress_callback(done, len(las_files))
+
+        # Read the unchanged wells from their cache
+        payloads = {}
+        if use_cache:
+            for las_file in pending:
+                payload = load_well_cache(las_file, signatures[las_file], with_data=not lazy)
+                if payload is not None:
+                    payloads[las_file] = payload
+            done += len(payloads)
+            if progress_callback and payloads:
+                progress_callback(done, len(las_files))
+        to_parse = [las_file for las_file in pending if las_file not in payloads]
+
+        # Parse the other files in parallel, each worker process is driven by its own thread
+        n_workers = max(1, min(max_workers or cpu_count(), len(to_parse)))
+        loaders = [IsolatedWellLoader(timeout) for _ in range(n_workers if to_parse else 0)]
+        for loader in loaders:
+            loader.start()
+        idle_loaders = queue.Queue()
+        for loader in loaders:
+            idle_loaders.put(loader)
+
+        def load(las_file):
+            loader = idle_loaders.get()
+            try:
+                return loader.load(las_file, signatures[las_file] if use_cache else None, header_only=lazy)
+            finally:
+                idle_loaders.put(loader)
+
+        try:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(load, las_file): las_file for las_file in to_parse}
+                for future in as_completed(futures):
+                    las_file = futures[future]
+                    payload, error = future.result()
+                    if error is None:
+                        payloads[las_file] = payload
+                    else:
+                        self.load_errors[las_file] = error
+
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, len(las_files))
+        finally:
+            for loader in loaders:
+                loader.stop()
+
+        # Build the wells and store the formation data and curve table of each one, in file order
         wells = []
-        for i, las_file in enumerate(las_files):
-            well = welly.Well.from_las(las_file)
-            wells.append(well)
-            
-            # Extract formation data from the ~Other section
-            self.extract_formation_data(well, las_file)
-            
-            if progress_callback:
-                progress_callback(i + 1, len(las_files))
+        load_lazy_well = functools.partial(self.load_lazy_well, use_cache=use_cache)
+        for las_file in pending:
+            if las_file not in payloads:
+                continue
+            payload = payloads[las_file]
+            try:
+                if not build_wells:
+                    well = None
+                elif lazy:
+                    well = LazyWell(las_file, payload['header'], payload['columns'], load_lazy_well, on_use=self.touch_lazy_well)
+                else:
+                    # Build the Well only if it was not built by a previous load
+                    well = load_well_object_cache(las_file, signatures[las_file]) if use_cache else None
+                    if well is None:
+                        well = well_from_payload(payload, las_file)
+                        if use_cache:
+                            try:
+                                save_well_object_cache(well, las_file, signatures[las_file])
+                            except (OSError, pickle.PicklingError, TypeError):
+                                pass
+            except Exception as e:
+                self.load_errors[las_file] = f"{type(e).__name__}: {e}"
+                continue
+            try:
+                well_name = next(iter(self.extract_formation_data(payload['header'], payload['formation_intervals'])))
+                if not lazy:
+                    self.well_frames[well_name] = frame_from_payload(payload)
+            except Exception as e:
+                self.load_errors[las_file] = f"Formation data: {type(e).__name__}: {e}"
+                continue
+            if well is not None:
+                self.add_to_well_index(well, well_name)
+                wells.append(well)
+
+        # Quarantine the new failures, except timeouts, and forget files that are no longer in the field
+        for las_file in pending:
+            if las_file in self.load_errors and not self.load_errors[las_file].startswith(TIMEOUT_ERROR_PREFIX):
+                size, mtime_ns = signatures[las_file]
+                quarantine[os.path.basename(las_file)] = {'size': size, 'mtime_ns': mtime_ns, 'error': self.load_errors[las_file]}
+        file_names = {os.path.basename(las_file) for las_file in las_files}
+        self.save_quarantine({name: record for name, record in quarantine.items() if name in file_names})
         
-        self.project = welly.Project(wells)
+        self.project = welly.Project(wells) if build_wells else None
         
         # Collect unique formations after all wells have been processed
         self.collect_unique_formations()
         
         return self.project
 
+    def load_lazy_well(self, lazy_well, use_cache=True):
+        """
+        Loads the curve data of a LazyWell, from its cache when it is valid, else parsed by an
+        isolated worker process that also writes the cache.
+
+        Args:
+            lazy_well (LazyWell): The well to load.
+            use_cache (bool): Read and write the well cache.
+
+        Returns:
+            dict: The payload of the well, see load_well_payload.
+
+        Raises:
+            WellLoadError: If the LAS file cannot be loaded. The error is recorded in load_errors, so
+                the file is not parsed again by this load, and the file is quarantined unless it
+                only timed out.
+        """
+        las_file = lazy_well.fname
+
+        # A file that already failed is not parsed again
+        if las_file in self.load_errors:
+            raise WellLoadError(f"Could not load the curves of {las_file}: {self.load_errors[las_file]}")
+
+        signature = self.get_file_signature(las_file)
+        payload = load_well_cache(las_file, signature) if use_cache else None
+        if payload is None:
+            if self.lazy_loader is None:
+                self.lazy_loader = IsolatedWellLoader(self.load_timeout)
+            payload, error = self.lazy_loader.load(las_file, signature if use_cache else None)
+            if error is not None:
+                self.load_errors[las_file] = error
+                if not error.startswith(TIMEOUT_ERROR_PREFIX):
+                    quarantine = self.load_quarantine()
+                    quarantine[os.path.basename(las_file)] = {'size': signature[0], 'mtime_ns': signature[1], 'error': error}
+                    self.save_quarantine(quarantine)
+                raise WellLoadError(f"Could not load the curves of {las_file}: {error}")
+        return payload
+
+    def loaded_wells(self, lease_names=None):
+        """
+        Yields the wells of the project whose curve data can be loaded, skipping the lazy wells
+        whose ~A section fails to load (see load_lazy_well).
+
+        Args:
+            lease_names (collection): Only yield the wells of these leases, all wells if None.
+        """
+        for well in self.project or []:
+            if lease_names is not None and self.get_lease_name(well) not in lease_names:
+                continue
+            if isinstance(well, LazyWell):
+                try:
+                    well.load()
+                except WellLoadError:
+                    continue
+            yield well
+
+    def get_file_signature(self, las_file):
+        """Returns [size, mtime_ns] of a file, used to detect that a quarantined file changed."""
+        stat = os.stat(las_file)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def quarantine_path(self):
+        """Path of the quarantine list of the selected field."""
+        return os.path.join(self.base_directory, self.selected_field, QUARANTINE_FILENAME)
+
+    def load_quarantine(self):
+        """
+        Loads the quarantine list of the selected field.
+
+        Returns:
+            dict: {file name: {'size', 'mtime_ns', 'error'}} of the files that failed to load.
+        """
+        try:
+            with open(self.quarantine_path(), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_quarantine(self, quarantine):
+        """
+        Saves the quarantine list of the selected field atomically, removing it when empty.
+
+        Args:
+            quarantine (dict): {file name: {'size', 'mtime_ns', 'error'}}
+        """
+        path = self.quarantine_path()
+        if not quarantine:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(quarantine, f, indent=4)
+        os.replace(tmp_path, path)
+
+    def clear_quarantine(self, file_names=None):
+        """
+        Removes files from the quarantine list of the selected field and from load_errors, so
+        they are parsed again by the next load.
+
+        Args:
+            file_names (collection): Base names of the LAS files to clear, all files if None.
+        """
+        quarantine = self.load_quarantine()
+        if file_names is None:
+            file_names = set(quarantine) | {os.path.basename(las_file) for las_file in self.load_errors}
+        self.save_quarantine({name: record for name, record in quarantine.items() if name not in file_names})
+        self.load_errors = {las_file: error for las_file, error in self.load_errors.items() if os.path.basename(las_file) not in file_names}
+
+    def retry_quarantined(self, file_names=None, **kwargs):
+        """
+        Clears the quarantined files and loads the selected field again, parsing them again.
+
+        Args:
+            file_names (collection): Base names of the LAS files to retry, all files if None.
+            **kwargs: Arguments of load_selected_field, e.g. a longer timeout.
+
+        Returns:
+            project: See load_selected_field.
+        """
+        self.clear_quarantine(file_names)
+        return self.load_selected_field(**kwargs)
+
     def collect_unique_formations(self):
         """
         Collects all unique formations across all wells in the selected field.
@@ -130,84 +826,360 @@ class ProjectManager:
                 all_formations.add(formation_name)
         self.unique_formations = all_formations
 
-    def extract_formation_data(self, well, las_file):
+    def extract_formation_data(self, header, formation_intervals):
         """
-        Extracts formation data from the ~Other section of the LAS file and prepares it for well logging plots.
+        Stores the formation data of a well, parsed from the ~Other section together with its curves.
         
         Args:
-            well (welly.Well): The well object.
-            las_file (str): Path to the LAS file.
+            header (pd.DataFrame): The welly header table of the well, well.header.
+            formation_intervals (list): [(top_depth, base_depth, formation_name), ...] of the well,
+                see build_formation_intervals.
             
         Returns:
             dict: A dictionary containing formation data for each well, formatted for plotting.
                 The structure is {well_name: [(top_depth, base_depth, formation_name), ...]}
         """
-        well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
-        self.formation_data[well_name] = []
-        
-        # Extract formation data from the ~Other section of the LAS file
-        with open(las_file, 'r') as file:
-            other_section = False
-            for line in file:
-                if line.strip().startswith('~Other'):
-                    other_section = True
-                    continue
-                if other_section and line.strip().startswith('~'):
-                    break
-                if other_section and line.strip():
-                    parts = line.strip().split(',')
-                    if len(parts) == 3 and parts[0].lower() != 'base':  # Skip header line
-                        base, top, formation = parts
-                        base = float(base) if base.lower() != 'nan' else None
-                        top = float(top) if top.lower() != 'nan' else None
-                        if top is not None:  # Ensure we have at least a top depth
-                            self.formation_data[well_name].append({
-                                'formation': formation.strip(),
-                                'top': top,
-                                'base': base
-                            })
-        
-        # Sort formations by top depth
-        self.formation_data[well_name].sort(key=lambda x: x['top'])
-        
-        # Prepare the formation data for plotting and fill missing base depths
-        formation_data = {}
-        start_depth = well.header.loc[well.header['mnemonic'] == 'STRT', 'value'].values[0]
-        stop_depth = well.header.loc[well.header['mnemonic'] == 'STOP', 'value'].values[0]
-        
-        # Initialize the formation data for the current well
-        formation_data[well_name] = []
-        
-        formations = self.formation_data[well_name]
-        
-        # Fill missing base depths
-        for i, formation in enumerate(formations):
-            formation_name = formation['formation']
-            top_depth = formation['top']
-            
-            # Handle missing base depths
-            if formation['base'] is not None:
-                base_depth = formation['base']
-            elif i < len(formations) - 1:
-                # If no base depth, use the next formation's top depth
-                base_depth = formations[i + 1]['top']
-            else:
-                # If this is the last formation, use the stop depth of the well
-                base_depth = stop_depth
-            
-            # Add the formation data
-            formation_data[well_name].append((top_depth, base_depth, formation_name))
-        
-        # Add top layer if necessary
-        if formations and formations[0]['top'] > start_depth:
-            formation_data[well_name].insert(0, (start_depth, formations[0]['top'], 'Unknown'))
-        
-        # Sort formations by top depth
-        formation_data[well_name].sort(key=lambda x: x[0])
-        
-        # Update the formation_data attribute and return the result
-        self.formation_data[well_name] = formation_data[well_name]
-        return formation_data
+        well_name = header.loc[header['mnemonic'] == 'LEASE', 'value'].values[0]
+        self.formation_data[well_name] = formation_intervals
+        return {well_name: formation_intervals}
+    # endregion
+
+    # region Well index
+    ########## --- Lease name <-> well lookups, built once at load time --- ##########
+    def build_well_index(self):
+        """
+        Indexes the wells of the project by lease name, reading each LEASE header once.
+        load_selected_field builds the index, call this again if the project is replaced.
+        """
+        self.well_index = {}
+        self.well_leases = {}
+        for well in self.project or []:
+            self.add_to_well_index(well, self.get_lease_name(well))
+
+    def add_to_well_index(self, well, lease_name):
+        """Adds a well and its lease name to the well index."""
+        self.well_leases[id(well)] = (well, lease_name)
+        # Keep the first well of a lease, as the scans of the project did
+        self.well_index.setdefault(lease_name, well)
+
+    def get_well(self, lease_name):
+        """
+        Returns the well of a lease name.
+
+        Args:
+            lease_name (str): Lease name of the well.
+
+        Returns:
+            welly.Well: The first well of the project with that lease name.
+
+        Raises:
+            KeyError: If no well of the project has that lease name.
+        """
+        return self.well_index[lease_name]
+
+    def get_lease_name(self, well):
+        """Returns the lease name of a well, reading its header only if the well is not indexed yet."""
+        entry = self.well_leases.get(id(well))
+        if entry is not None and entry[0] is well:
+            return entry[1]
+        lease_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+        self.well_leases[id(well)] = (well, lease_name)
+        return lease_name
+
+    def get_lease_names(self):
+        """Returns the lease names of the wells of the project, in project order."""
+        return [self.get_lease_name(well) for well in self.project]
+    # endregion
+
+    # region LAS catalog
+    ########## --- SQLite header catalog of every field, see utils/las_inventory.py --- ##########
+    def has_catalog(self):
+        """Checks whether the LAS catalog of the base directory exists."""
+        return os.path.exists(catalog_path(self.base_directory))
+
+    def scan_catalog(self):
+        """
+        Builds or refreshes the LAS catalog of every field, reading only new or changed LAS files up to ~A.
+        """
+        scan_las_inventory(self.base_directory)
+        self.fields = self.load_fields()
+
+    def query_catalog(self, query, params=()):
+        """
+        Runs a SQL query on the LAS catalog, scanning the fields first if there is no catalog yet.
+
+        Args:
+            query (str): SQL query on the files, curves, header_items and formations tables.
+            params (tuple): Parameters of the query.
+
+        Returns:
+            pd.DataFrame: Result of the query.
+        """
+        if not self.has_catalog():
+            scan_las_inventory(self.base_directory)
+        return query_catalog(self.base_directory, query, params)
+
+    def get_field_summary(self):
+        """
+        Counts the wells, curves and data size of every field from the catalog.
+
+        Returns:
+            pd.DataFrame: One row per field with wells, curves (distinct mnemonics), size_mb,
+                unreadable files and the depth range of its wells.
+        """
+        return self.query_catalog("""
+            SELECT f.field,
+                   SUM(f.error IS NULL) AS wells,
+                   (SELECT COUNT(DISTINCT c.mnemonic) FROM curves c WHERE c.field = f.field AND c.position > 0) AS curves,
+                   ROUND(SUM(f.size) / 1e6, 2) AS size_mb,
+                   SUM(f.error IS NOT NULL) AS unreadable,
+                   MIN(f.strt) AS min_depth,
+                   MAX(f.stop) AS max_depth
+            FROM files f
+            GROUP BY f.field
+            ORDER BY f.field
+        """)
+
+    def get_catalog_curves(self, fields=None):
+        """
+        Lists the curves available in the given fields without loading any well.
+
+        Args:
+            fields (list): Field names, all fields if None.
+
+        Returns:
+            pd.DataFrame: One row per curve mnemonic with a unit and description, the number of
+                wells and fields holding it and the depth range of those wells, most common first.
+        """
+        field_filter, params = self.catalog_field_filter(fields)
+        return self.query_catalog(f"""
+            SELECT c.mnemonic, MAX(c.unit) AS unit, MAX(c.description) AS description,
+                   COUNT(*) AS wells, COUNT(DISTINCT c.field) AS fields,
+                   MIN(f.strt) AS min_depth, MAX(f.stop) AS max_depth
+            FROM curves c JOIN files f ON f.field = c.field AND f.file = c.file
+            WHERE c.position > 0 {field_filter}
+            GROUP BY c.mnemonic
+            ORDER BY wells DESC, c.mnemonic
+        """, params)
+
+    def get_wells_by_curves(self, curves, fields=None):
+        """
+        Finds the wells holding all the given curves, e.g. ['RHOC', 'CNLS'], without loading any well.
+
+        Args:
+            curves (list): Curve mnemonics every returned well must have.
+            fields (list): Field names, all fields if None.
+
+        Returns:
+            pd.DataFrame: field, file, lease, strt, stop and size of each matching well.
+        """
+        field_filter, params = self.catalog_field_filter(fields)
+        placeholders = ', '.join('?' * len(curves))
+        return self.query_catalog(f"""
+            SELECT c.field, c.file, f.lease, f.strt, f.stop, f.size
+            FROM curves c JOIN files f ON f.field = c.field AND f.file = c.file
+            WHERE c.mnemonic IN ({placeholders}) {field_filter}
+            GROUP BY c.field, c.file
+            HAVING COUNT(DISTINCT c.mnemonic) = ?
+            ORDER BY c.field, c.file
+        """, tuple(curves) + params + (len(set(curves)),))
+
+    def catalog_field_filter(self, fields, alias='c'):
+        """Returns the SQL condition and parameters restricting a catalog query to the given fields."""
+        if fields is None:
+            return '', ()
+        return f"AND {alias}.field IN ({', '.join('?' * len(fields))})", tuple(fields)
+
+    def get_catalog_curve_descriptions(self, field=None):
+        """
+        Retrieves the curve descriptions of a field from the catalog, in the format of get_curve_descriptions.
+
+        Args:
+            field (str): Field name, the selected field if None.
+
+        Returns:
+            dict: {curve name: {lease name: description}}
+        """
+        field = field or self.selected_field
+        curves = self.query_catalog("""
+            SELECT c.mnemonic, f.lease, c.description, c.value, c.unit
+            FROM curves c JOIN files f ON f.field = c.field AND f.file = c.file
+            WHERE c.field = ?
+            ORDER BY c.file, c.position
+        """, (field,))
+
+        # Same fallback as get_curve_descriptions: description, else API code, else unit
+        curve_descriptions = {}
+        for curve_name, lease_name, description, value, unit in curves.itertuples(index=False):
+            curve_descriptions.setdefault(curve_name, {})[lease_name] = description if description else value if value else unit
+        return curve_descriptions
+    # endregion
+
+    # region Field store
+    ########## --- Memory-mapped curves shared by worker processes, see utils/field_store.py --- ##########
+    def build_field_store(self):
+        """
+        Writes the depth index and curves of the loaded wells to the field store of the selected
+        field and maps it. From then on descriptive_statistics, detect_all_outliers and the
+        missingno report read curves as views of the store, and worker processes receive the
+        (path, byte offset, length, dtype) slices of their curves instead of pickled copies. The store is
+        dropped by the next load_selected_field.
+
+        Returns:
+            FieldCurveStore: The store of the selected field.
+        """
+        path = os.path.join(self.base_directory, self.selected_field, WELL_CACHE_FOLDER, FIELD_STORE_FILENAME)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.field_store = write_field_store(dict(self.iter_well_frames()), path)
+        return self.field_store
+
+    def get_curve_view(self, well_name, curve):
+        """
+        Returns a curve of a well as a read-only view of the field store.
+
+        Args:
+            well_name (str): Lease name of the well.
+            curve (str): Curve mnemonic.
+
+        Returns:
+            np.ndarray: The view, or None if the well has no such curve or the store is not built.
+        """
+        if self.field_store is None:
+            return None
+        return self.field_store.curve(well_name, curve)
+
+    def get_depth_view(self, well_name):
+        """Returns the depth index of a well as a view of the field store, None if the store is not built."""
+        if self.field_store is None or well_name not in self.field_store:
+            return None
+        return self.field_store.depth(well_name)
+
+    def get_curve_arrays(self, curve_name):
+        """
+        Returns the values of a curve in every well holding it, as views of the field store
+        when it is built, else from the welly curves.
+
+        Args:
+            curve_name (str): Curve mnemonic.
+
+        Returns:
+            list: [(lease name, values), ...]
+        """
+        if self.field_store is not None:
+            return [(well_name, self.field_store.curve(well_name, curve_name)) for well_name in self.field_store.wells if curve_name in self.field_store.wells[well_name]]
+        curve_arrays = []
+        for well in self.project:
+            # Lazy wells that fail to load are skipped, see load_lazy_well
+            try:
+                if curve_name in well.data and well.data[curve_name]:
+                    lease_name = self.get_lease_name(well)
+                    curve_arrays.append((lease_name, well.data[curve_name].values))
+            except WellLoadError:
+                continue
+        return curve_arrays
+    # endregion
+
+    # region Memory budget
+    ########## --- Accounting of the memory held by each component, LRU unloading of lazy wells --- ##########
+    def component_nbytes(self):
+        """
+        Estimates the bytes held by each component of the project.
+
+        Returns:
+            dict: Bytes of 'wells' (curve arrays of the loaded wells), 'prepared_data', 'outliers'
+                and each registered component.
+        """
+        if self.well_lru:
+            wells_nbytes = sum(well.nbytes for well in self.well_lru.values())
+        else:
+            wells_nbytes = sum(estimate_nbytes(well_df) for well_df in self.well_frames.values())
+        nbytes = {
+            'wells': wells_nbytes,
+            'prepared_data': estimate_nbytes(self.prepared_data),
+            'outliers': estimate_nbytes(self.outliers),
+        }
+        for name, data in self.components.items():
+            nbytes[name] = estimate_nbytes(data)
+        return nbytes
+
+    def memory_usage(self):
+        """
+        Reports the memory held by each component of the project.
+
+        Returns:
+            dict: MB held by each component (see component_nbytes) and their 'total', plus
+                'loaded_wells', the number of lazy wells whose curves are loaded, and
+                'field_store', the MB mapped from disk by the field store, not in the total.
+        """
+        nbytes = self.component_nbytes()
+        usage = {name: round(value / 1e6, 2) for name, value in nbytes.items()}
+        usage['total'] = round(sum(nbytes.values()) / 1e6, 2)
+        usage['loaded_wells'] = len(self.well_lru)
+        usage['field_store'] = round(os.path.getsize(self.field_store.path) / 1e6, 2) if self.field_store is not None else 0.0
+        return usage
+
+    def register_component(self, name, data):
+        """
+        Records data held by another component, e.g. the combined table of the missingno UI, so
+        it is accounted for in memory_usage and the memory budget. Components register their
+        data again when they replace it, and all are forgotten by the next load_selected_field.
+
+        Args:
+            name (str): Name of the component.
+            data: The data it holds, None to forget it.
+        """
+        if data is None:
+            self.components.pop(name, None)
+        else:
+            self.components[name] = data
+            self.enforce_memory_budget()
+
+    def set_memory_budget(self, memory_budget_mb):
+        """
+        Sets the memory budget and unloads wells to fit it. The budget applies to the fields
+        loaded from then on, which are loaded lazily.
+
+        Args:
+            memory_budget_mb (float): MB the project may hold, None for no budget.
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self.enforce_memory_budget()
+
+    def touch_lazy_well(self, lazy_well):
+        """Marks a lazy well as the most recently used, enforcing the memory budget when it was just loaded."""
+        key = id(lazy_well)
+        if key in self.well_lru:
+            self.well_lru.move_to_end(key)
+            return
+        self.well_lru[key] = lazy_well
+        self.enforce_memory_budget(keep=lazy_well)
+
+    def enforce_memory_budget(self, keep=None):
+        """
+        Unloads the curve data of the least recently used lazy wells until the memory accounted
+        by component_nbytes fits the budget. Unloaded wells are loaded again, from the well
+        cache or the LAS file, the next time they are used.
+
+        Args:
+            keep (LazyWell): Well being used, never unloaded.
+
+        Returns:
+            int: Number of wells unloaded.
+        """
+        if self.memory_budget_mb is None or not self.well_lru:
+            return 0
+        excess = sum(self.component_nbytes().values()) - self.memory_budget_mb * 1e6
+        unloaded = 0
+        for key, well in list(self.well_lru.items()):
+            if excess <= 0:
+                break
+            if well is keep:
+                continue
+            excess -= well.nbytes
+            well.unload()
+            del self.well_lru[key]
+            unloaded += 1
+        return unloaded
     # endregion
 
     # region Filtering curves
@@ -260,7 +1232,7 @@ class ProjectManager:
             return {}
 
         for well in self.project:
-            lease_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+            lease_name = self.get_lease_name(well)
             header_df = well.header
             curve_info = header_df[header_df['section'] == 'Curves']
             for _, row in curve_info.iterrows():
@@ -288,12 +1260,13 @@ class ProjectManager:
         # Define thresholds or criteria for data filtering
         valid_range = (-1000, 10000)  # Example range, adjust based on your data characteristics
 
+        # Values of each curve in every well, views of the field store when it is built
+        curve_arrays = {curve_name: self.get_curve_arrays(curve_name) for curve_name in self.selected_curves}
+
         # Statistics for the entire field
         for curve_name in self.selected_curves:
             # Collecting data from all wells for the curve
-            combined_curve_data = np.concatenate([
-                well.data[curve_name].values for well in self.project if curve_name in well.data and well.data[curve_name]
-            ])
+            combined_curve_data = np.concatenate([values for _, values in curve_arrays[curve_name]], dtype=np.float64)
             
             # Filter data based on valid range
             filtered_data = combined_curve_data[(combined_curve_data >= valid_range[0]) & (combined_curve_data <= valid_range[1])]
@@ -319,30 +1292,32 @@ class ProjectManager:
                 field_stats[curve_name] = {stat: np.nan for stat in ['mean', 'median', 'mode', 'std_dev', 'range', 'variance', 'skewness', 'kurtosis', 'IQR', 'MAD', 'CV', 'percentile25', 'percentile75']}
 
         # Statistics for each well
-        for well in self.project:
-            lease_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+        if self.field_store is not None:
+            well_names = list(self.field_store.wells)
+        else:
+            well_names = self.get_lease_names()
+        for lease_name in well_names:
             well_stats[lease_name] = {}
-            for curve_name in self.selected_curves:
-                if curve_name in well.data and well.data[curve_name]:
-                    curve_data = well.data[curve_name].values
-                    # Filter data based on valid range
-                    filtered_data = curve_data[(curve_data >= valid_range[0]) & (curve_data <= valid_range[1])]
-                    if filtered_data.size > 0:
-                        well_stats[lease_name][curve_name] = {
-                            'mean': np.mean(filtered_data),
-                            'median': np.median(filtered_data),
-                            'mode': pd.Series(filtered_data).mode()[0] if not pd.Series(filtered_data).mode().empty else np.nan,
-                            'std_dev': np.std(filtered_data),
-                            'range': (np.min(filtered_data), np.max(filtered_data)),
-                            'variance': np.var(filtered_data),
-                            'skewness': scipy.stats.skew(filtered_data),
-                            'kurtosis': scipy.stats.kurtosis(filtered_data),
-                            'IQR': np.percentile(filtered_data, 75) - np.percentile(filtered_data, 25),
-                            'MAD': np.median(np.absolute(filtered_data - np.median(filtered_data))),
-                            'CV': np.std(filtered_data) / np.mean(filtered_data) if np.mean(filtered_data) != 0 else np.nan,
-                            'percentile25': np.percentile(filtered_data, 25),
-                            'percentile75': np.percentile(filtered_data, 75),
-                        }
+        for curve_name in self.selected_curves:
+            for lease_name, curve_data in curve_arrays[curve_name]:
+                # Filter data based on valid range
+                filtered_data = np.asarray(curve_data[(curve_data >= valid_range[0]) & (curve_data <= valid_range[1])], dtype=np.float64)
+                if filtered_data.size > 0:
+                    well_stats[lease_name][curve_name] = {
+                        'mean': np.mean(filtered_data),
+                        'median': np.median(filtered_data),
+                        'mode': pd.Series(filtered_data).mode()[0] if not pd.Series(filtered_data).mode().empty else np.nan,
+                        'std_dev': np.std(filtered_data),
+                        'range': (np.min(filtered_data), np.max(filtered_data)),
+                        'variance': np.var(filtered_data),
+                        'skewness': scipy.stats.skew(filtered_data),
+                        'kurtosis': scipy.stats.kurtosis(filtered_data),
+                        'IQR': np.percentile(filtered_data, 75) - np.percentile(filtered_data, 25),
+                        'MAD': np.median(np.absolute(filtered_data - np.median(filtered_data))),
+                        'CV': np.std(filtered_data) / np.mean(filtered_data) if np.mean(filtered_data) != 0 else np.nan,
+                        'percentile25': np.percentile(filtered_data, 25),
+                        'percentile75': np.percentile(filtered_data, 75),
+                    }
 
         self.field_stats = field_stats
         self.well_stats = well_stats
@@ -350,7 +1325,8 @@ class ProjectManager:
     # endregion
 
     # region Outliers
-    def apply_method(self, method, data, **kwargs):
+    @classmethod
+    def apply_method(cls, method, data, **kwargs):
         """
         Applies a specific outlier detection method to the data.
         
@@ -363,17 +1339,17 @@ class ProjectManager:
             list: Indices of detected outliers.
         """
         if method == 'z_score':
-            return self.detect_z_score_outliers(data, threshold=kwargs.get('threshold', 3.0))
+            return cls.detect_z_score_outliers(data, threshold=kwargs.get('threshold', 3.0))
         elif method == 'modified_z_score':
-            return self.detect_modified_z_score_outliers(data, threshold=kwargs.get('threshold', 3.5))
+            return cls.detect_modified_z_score_outliers(data, threshold=kwargs.get('threshold', 3.5))
         elif method == 'iqr':
-            return self.detect_iqr_outliers(data, factor=kwargs.get('factor', 1.5))
+            return cls.detect_iqr_outliers(data, factor=kwargs.get('factor', 1.5))
         elif method == 'isolation_forest':
-            return self.detect_isolation_forest_outliers(data, contamination=kwargs.get('contamination', 0.01))
+            return cls.detect_isolation_forest_outliers(data, contamination=kwargs.get('contamination', 0.01))
         elif method == 'dbscan':
-            return self.detect_dbscan_outliers(data, eps=kwargs.get('eps', 0.5), min_samples=kwargs.get('min_samples', 5))
+            return cls.detect_dbscan_outliers(data, eps=kwargs.get('eps', 0.5), min_samples=kwargs.get('min_samples', 5))
         elif method == 'local_outlier_factor':
-            return self.detect_local_outlier_factor_outliers(
+            return cls.detect_local_outlier_factor_outliers(
                 data,
                 n_neighbors=kwargs.get('n_neighbors', 20),
                 contamination=kwargs.get('contamination', 'auto')
@@ -381,9 +1357,23 @@ class ProjectManager:
         else:
             raise ValueError(f"Unsupported outlier detection method: {method}")
 
-    def process_curve(self, args):
-        well_name, well, curve = args
-        data = well.data[curve].values
+    @staticmethod
+    def process_curve(args):
+        """
+        Outlier worker: applies each method to the non-NaN values of one curve.
+
+        Args:
+            args (tuple): (well_name, data, curve, methods, kwargs), data is the curve array or
+                its (path, byte offset, length, dtype) slice in the field store.
+
+        Returns:
+            tuple: (well_name, curve, {method: outlier indices in the curve})
+        """
+        well_name, data, curve, methods, kwargs = args
+        # The detectors always work in float64, whatever the store holds
+        if isinstance(data, tuple):
+            data = read_curve_slice(data)
+        data = np.asarray(data, dtype=np.float64)
         mask = ~np.isnan(data)
         clean_data = data[mask]
 
@@ -391,9 +1381,9 @@ class ProjectManager:
             return well_name, curve, {}
 
         outlier_indices_dict = {}
-        for method in self.methods:
-            method_params = self.kwargs.get(method, {})
-            outlier_indices_in_clean_data = self.apply_method(method, clean_data, **method_params)
+        for method in methods:
+            method_params = kwargs.get(method, {})
+            outlier_indices_in_clean_data = ProjectManager.apply_method(method, clean_data, **method_params)
             outlier_indices = np.where(mask)[0][outlier_indices_in_clean_data]
             outlier_indices_dict[method] = outlier_indices.tolist()
 
@@ -412,15 +1402,23 @@ class ProjectManager:
         # Initialize the outliers dictionary
         self.outliers = {method: {} for method in methods}
         
+        # Send each worker the curve array only, not the whole well, or just where the curve lies
+        # in the field store when it is built so the workers read it from its shared pages
         well_curve_pairs = []
-        for well in self.project:
-            well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
-            for curve in curves:
-                if curve in well.data:
-                    well_curve_pairs.append((well_name, well, curve))
+        if self.field_store is not None:
+            for well_name in self.field_store.wells:
+                for curve in curves:
+                    curve_slice = self.field_store.curve_slice(well_name, curve)
+                    if curve_slice is not None:
+                        well_curve_pairs.append((well_name, curve_slice, curve, methods, kwargs))
+        else:
+            for well_name, well_df in self.iter_well_frames():
+                for curve in curves:
+                    if curve in well_df.columns:
+                        well_curve_pairs.append((well_name, well_df[curve].to_numpy(), curve, methods, kwargs))
         
         with Pool(processes=cpu_count()) as pool:
-            results = pool.map(self.process_curve, well_curve_pairs)
+            results = pool.map(ProjectManager.process_curve, well_curve_pairs)
         
         # Organize results into the outliers dictionary
         for well_name, curve, outlier_indices_dict in results:
@@ -429,10 +1427,13 @@ class ProjectManager:
                     self.outliers[method][well_name] = {}
                 self.outliers[method][well_name][curve] = outlier_indices
 
+        self.enforce_memory_budget()
+
         # return self.outliers
         return 'Outliers detected successfully'
 
-    def detect_z_score_outliers(self, data, threshold=3.0):
+    @staticmethod
+    def detect_z_score_outliers(data, threshold=3.0):
         """
         Detects outliers using the Z-Score method.
 
@@ -450,7 +1451,8 @@ class ProjectManager:
         outlier_indices = np.where(z_scores > threshold)[0]
         return outlier_indices.tolist()
     
-    def detect_modified_z_score_outliers(self, data, threshold=3.5):
+    @staticmethod
+    def detect_modified_z_score_outliers(data, threshold=3.5):
         """
         Detects outliers using the Modified Z-Score method.
 
@@ -473,7 +1475,8 @@ class ProjectManager:
         outlier_indices = np.where(np.abs(modified_z_scores) > threshold)[0]
         return outlier_indices.tolist()
     
-    def detect_iqr_outliers(self, data, factor=1.5):
+    @staticmethod
+    def detect_iqr_outliers(data, factor=1.5):
         """
         Detects outliers using the Interquartile Range (IQR) method.
 
@@ -496,7 +1499,8 @@ class ProjectManager:
         outlier_indices = np.where((data < lower_bound) | (data > upper_bound))[0]
         return outlier_indices.tolist()
     
-    def detect_isolation_forest_outliers(self, data, contamination=0.01):
+    @staticmethod
+    def detect_isolation_forest_outliers(data, contamination=0.01):
         """
         Detects outliers using the Isolation Forest method.
 
@@ -516,7 +1520,8 @@ class ProjectManager:
         outlier_indices = np.where(preds == -1)[0]
         return outlier_indices.tolist()
     
-    def detect_dbscan_outliers(self, data, eps=0.5, min_samples=5):
+    @staticmethod
+    def detect_dbscan_outliers(data, eps=0.5, min_samples=5):
         """
         Detects outliers using the DBSCAN clustering method.
 
@@ -537,7 +1542,8 @@ class ProjectManager:
         outlier_indices = np.where(labels == -1)[0]
         return outlier_indices.tolist()
     
-    def detect_local_outlier_factor_outliers(self, data, n_neighbors=20, contamination='auto'):
+    @staticmethod
+    def detect_local_outlier_factor_outliers(data, n_neighbors=20, contamination='auto'):
         """
         Detects outliers using the Local Outlier Factor method.
 
@@ -558,6 +1564,34 @@ class ProjectManager:
         outlier_indices = np.where(preds == -1)[0]
         return outlier_indices.tolist()
 
+    def iter_well_frames(self):
+        """
+        Yields (lease name, depth-indexed curve DataFrame) for each well, from the curve tables
+        kept at load time, or from well.df() of the project's wells if there are none. Lazy
+        wells are loaded one at a time as they are yielded, those that fail to load are skipped.
+        """
+        # The last well of a lease wins, as in well_frames
+        lazy_wells = {self.get_lease_name(well): well for well in self.project or [] if isinstance(well, LazyWell)}
+        if lazy_wells:
+            # The memory budget may unload the wells already yielded, wells that fail to load are skipped
+            for lease_name, well in lazy_wells.items():
+                try:
+                    well.load()
+                except WellLoadError:
+                    continue
+                yield lease_name, well.frame
+            return
+        if self.well_frames:
+            yield from self.well_frames.items()
+            return
+        for well in self.project:
+            # Use lease name as well identifier
+            lease_name = self.get_lease_name(well)
+            try:
+                yield lease_name, well.df()
+            except IndexError:
+                print(f"Skipping well '{lease_name}' due to empty data.")
+
     def prepare_data(self, min_methods: int = 2) -> None:
         """
         Prepares data for machine learning by filtering outliers, ordering curves according to mapping,
@@ -575,16 +1609,7 @@ class ProjectManager:
 
         self.prepared_data = {}
 
-        for well in self.project:
-            # Use lease name as well identifier
-            lease_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
-            
-            try:
-                well_df = well.df()
-            except IndexError:
-                print(f"Skipping well '{lease_name}' due to empty data.")
-                continue
-            
+        for lease_name, well_df in self.iter_well_frames():
             # Copy DataFrame to avoid modifying original data
             filtered_df = well_df.copy()
             
@@ -693,5 +1718,6 @@ class ProjectManager:
             # Store the DataFrame
             self.prepared_data[lease_name] = prepared_df
 
+        self.enforce_memory_budget()
         print("Data has been prepared successfully.")
     # endregion
@@ -0,0 +1,316 @@
+import hashlib
+import io
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import download_las_files
+from utils.download_las_files import AdaptiveConcurrencyController, ConnectionPool, download_file, download_file_with_retries
+
+def make_las_zip(las_id):
+    """Builds the bytes of a small zip holding one LAS file."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr(f"{las_id}.las", f"~Version\n VERS. 2.0 :\n~A\n{las_id}\n" * 50)
+    return buffer.getvalue()
+
+class LasRequestHandler(BaseHTTPRequestHandler):
+    """Serves /<las_id>.zip with 'Range: bytes=<start>-' support, failing or stalling the first requests as configured on the server."""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            number = len(server.requests)
+            server.requests.append(self.path)
+            server.ranges.append(self.headers.get('Range'))
+            server.connections.add(self.client_address)
+
+        # Fail the first requests with a server error
+        if number < server.failures:
+            body = b'busy'
+            self.send_response(503)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        # Stall the first requests past the client timeout, then answer slowly
+        time.sleep(server.stall if number < server.stalls else server.latency)
+
+        body = make_las_zip(self.path.strip('/').split('.')[0])
+
+        # Serve the requested tail of the body
+        requested = self.headers.get('Range')
+        if requested:
+            start = int(requested.split('=')[1].rstrip('-'))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Range', f"bytes */{len(body)}")
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+            body = body[start:]
+        else:
+            self.send_response(200)
+        if server.chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for start in range(0, len(body), 100):
+                chunk = body[start:start + 100]
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+class LasServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), LasRequestHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.ranges = []
+        self.connections = set()
+        self.failures = 0
+        self.stalls = 0
+        self.stall = 0.0
+        self.latency = 0.0
+        self.chunked = False
+
+    def url(self, las_id):
+        return f"http://127.0.0.1:{self.server_address[1]}/{las_id}.zip"
+
+@pytest.fixture
+def server():
+    server = LasServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """Records the backoff bounds drawn between retries and keeps the sleeps short."""
+    bounds = []
+    monkeypatch.setattr(download_las_files, 'BACKOFF_BASE', 0.01)
+    monkeypatch.setattr(download_las_files.random, 'uniform', lambda low, high: bounds.append((low, high)) or high)
+    return bounds
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(timeout=5)
+    yield pool
+    pool.close_all()
+
+def test_keep_alive_connection_is_reused(server, pool, tmp_path):
+    las_ids = [str(1000 + i) for i in range(5)]
+
+    for las_id in las_ids:
+        _, error, _, received = download_file(las_id, server.url(las_id), tmp_path, pool)
+        assert error is None
+        assert received == len(make_las_zip(las_id))
+
+    # Every request of the thread went over the same socket
+    assert len(server.requests) == 5
+    assert len(server.connections) == 1
+
+def test_chunked_body_is_streamed_to_disk(server, pool, tmp_path, monkeypatch):
+    server.chunked = True
+    monkeypatch.setattr(download_las_files, 'CHUNK_SIZE', 64)
+    body = make_las_zip('1010')
+
+    _, error, record, received = download_file('1010', server.url('1010'), tmp_path, pool)
+
+    assert error is None
+    assert received == len(body)
+    assert record['size'] == len(body)
+    assert record['sha256'] == hashlib.sha256(body).hexdigest()
+    assert (tmp_path / '1010.zip').read_bytes() == body
+    assert not (tmp_path / '1010.zip.part').exists()
+
+    # The chunked body was read to its end, so the connection is still usable
+    download_file('1011', server.url('1011'), tmp_path, pool)
+    assert len(server.connections) == 1
+
+def test_transient_errors_are_retried_with_exponential_backoff(server, backoffs, pool, tmp_path):
+    server.failures = 2
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+
+    las_id, error, record, stats = download_file_with_retries('1001', server.url('1001'), tmp_path, pool, controller, max_retries=3)
+
+    assert error is None
+    assert stats['attempts'] == 3
+    assert len(server.requests) == 3
+    assert backoffs == [(0, 0.01), (0, 0.02)]
+    assert (tmp_path / '1001.zip').read_bytes() == make_las_zip('1001')
+    assert record['size'] == len(make_las_zip('1001'))
+
+def test_retries_stop_after_max_retries(server, backoffs, pool, tmp_path):
+    server.failures = 100
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+
+    las_id, error, record, stats = download_file_with_retries('1002', server.url('1002'), tmp_path, pool, controller, max_retries=2)
+
+    assert record is None
+    assert 'HTTP Error 503' in error and '(after 3 attempts)' in error
+    assert stats['attempts'] == 3
+    assert len(server.requests) == 3
+    assert backoffs == [(0, 0.01), (0, 0.02)]
+    assert not (tmp_path / '1002.zip').exists()
+
+def test_slow_response_times_out_and_is_retried(server, backoffs, tmp_path):
+    server.stalls = 1
+    server.stall = 1.0
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+    pool = ConnectionPool(timeout=0.2)
+    try:
+        las_id, error, record, stats = download_file_with_retries('1003', server.url('1003'), tmp_path, pool, controller, max_retries=3)
+    finally:
+        pool.close_all()
+
+    assert error is None
+    assert stats['attempts'] == 2
+    assert len(backoffs) == 1
+    assert (tmp_path / '1003.zip').read_bytes() == make_las_zip('1003')
+
+def test_local_file_errors_are_not_retried(server, backoffs, pool, tmp_path):
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+
+    # The .part file cannot be created in a folder that does not exist
+    with pytest.raises(FileNotFoundError):
+        download_file_with_retries('1004', server.url('1004'), tmp_path / 'missing', pool, controller, max_retries=3)
+
+    assert len(server.requests) == 1
+    assert backoffs == []
+
+    # The slot of the failed attempt was given back
+    controller.acquire()
+    controller.release()
+
+def test_controller_shrinks_on_errors_and_grows_back(server, backoffs, pool, tmp_path):
+    server.failures = 8
+    server.latency = 0.02
+    controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=8)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda las_id: download_file_with_retries(las_id, server.url(las_id), tmp_path, pool, controller, max_retries=5),
+            [str(2000 + i) for i in range(40)],
+        ))
+
+    assert all(error is None for _, error, _, _ in results)
+    history = controller.limit_history
+
+    # The failing first epoch halves the limit, the healthy epochs after it raise it again
+    assert history[0] == 8
+    assert history[1] == 4
+    assert max(history[2:]) > 4
+
+def test_interrupted_download_resumes_from_part_file(server, pool, tmp_path):
+    body = make_las_zip('1020')
+    (tmp_path / '1020.zip.part').write_bytes(body[:300])
+
+    _, error, record, received = download_file('1020', server.url('1020'), tmp_path, pool)
+
+    # Only the missing tail went over the network
+    assert error is None
+    assert server.ranges == ['bytes=300-']
+    assert received == len(body) - 300
+    assert (tmp_path / '1020.zip').read_bytes() == body
+    assert record['sha256'] == hashlib.sha256(body).hexdigest()
+    assert not (tmp_path / '1020.zip.part').exists()
+
+def test_complete_part_file_is_kept_on_416(server, pool, tmp_path):
+    body = make_las_zip('1021')
+    (tmp_path / '1021.zip.part').write_bytes(body)
+
+    _, error, record, received = download_file('1021', server.url('1021'), tmp_path, pool)
+
+    assert error is None
+    assert server.ranges == [f"bytes={len(body)}-"]
+    assert received == 0
+    assert (tmp_path / '1021.zip').read_bytes() == body
+    assert record['size'] == len(body)
+
+def test_broken_part_file_is_fetched_again_on_416(server, pool, tmp_path):
+    body = make_las_zip('1022')
+    (tmp_path / '1022.zip.part').write_bytes(b'x' * (len(body) + 10))
+
+    _, error, record, received = download_file('1022', server.url('1022'), tmp_path, pool)
+
+    # The unsatisfiable range is followed by a full download
+    assert error is None
+    assert server.ranges == [f"bytes={len(body) + 10}-", None]
+    assert received == len(body)
+    assert (tmp_path / '1022.zip').read_bytes() == body
+
+def test_manifest_skips_unchanged_zip(server, pool, tmp_path):
+    _, _, record, _ = download_file('1023', server.url('1023'), tmp_path, pool)
+
+    _, error, skipped_record, received = download_file('1023', server.url('1023'), tmp_path, pool, record)
+
+    assert error is None
+    assert skipped_record == record
+    assert received == 0
+    assert len(server.requests) == 1
+
+def test_truncated_zip_is_fetched_again(server, pool, tmp_path):
+    body = make_las_zip('1024')
+    _, _, record, _ = download_file('1024', server.url('1024'), tmp_path, pool)
+    (tmp_path / '1024.zip').write_bytes(body[:100])
+
+    _, error, new_record, received = download_file('1024', server.url('1024'), tmp_path, pool, record)
+
+    assert error is None
+    assert len(server.requests) == 2
+    assert received == len(body)
+    assert (tmp_path / '1024.zip').read_bytes() == body
+    assert new_record['sha256'] == record['sha256']
+
+def test_modified_zip_is_verified_and_fetched_again(server, pool, tmp_path):
+    body = make_las_zip('1025')
+    _, _, record, _ = download_file('1025', server.url('1025'), tmp_path, pool)
+    zip_path = tmp_path / '1025.zip'
+
+    # Touched but still the verified bytes, kept after hashing
+    os.utime(zip_path, ns=(record['mtime_ns'] + 10**9, record['mtime_ns'] + 10**9))
+    _, error, touched_record, received = download_file('1025', server.url('1025'), tmp_path, pool, record)
+    assert error is None and received == 0
+    assert touched_record['mtime_ns'] == record['mtime_ns'] + 10**9
+    assert len(server.requests) == 1
+
+    # Corrupted at the same size, fetched again
+    zip_path.write_bytes(b'x' + body[1:])
+    _, error, _, received = download_file('1025', server.url('1025'), tmp_path, pool, touched_record)
+    assert error is None and received == len(body)
+    assert zip_path.read_bytes() == body
+    assert len(server.requests) == 2
+
+def test_verify_catches_corruption_with_unchanged_mtime(server, pool, tmp_path):
+    body = make_las_zip('1026')
+    _, _, record, _ = download_file('1026', server.url('1026'), tmp_path, pool)
+    zip_path = tmp_path / '1026.zip'
+    zip_path.write_bytes(b'x' + body[1:])
+    os.utime(zip_path, ns=(record['mtime_ns'], record['mtime_ns']))
+
+    # Looks unchanged, so only a verify run notices
+    download_file('1026', server.url('1026'), tmp_path, pool, record)
+    assert len(server.requests) == 1
+
+    _, error, _, received = download_file('1026', server.url('1026'), tmp_path, pool, record, verify=True)
+    assert error is None and received == len(body)
+    assert zip_path.read_bytes() == body
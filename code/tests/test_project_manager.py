@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from src import project_manager
+from src.project_manager import IsolatedWellLoader, ProjectManager
+
+LAS_TEXT = """~Version ---------------------------------------------------
+VERS.   2.0 : CWLS log ASCII Standard -VERSION 2.0
+WRAP.    NO : One line per depth step
+~Well ------------------------------------------------------
+STRT  .FT                       1000.0 :
+STOP  .FT                       1002.0 :
+STEP  .FT                          0.5 :
+NULL  .                        -999.25 :
+WELL  .                       {name} : WELL_NAME
+FLD   .                         Arroyo : FIELD_NAME
+UWI   .                   15-187-0003{number} : API
+LEASE .                       {name} : LEASE
+~Curve Information -----------------------------------------
+DEPT.FT    :
+GR  .GAPI  :
+RHOB.G/C3  :
+~Other -----------------------------------------------------
+BASE,TOP,FORMATION
+nan,1001.0,Cottonwood Limestone Member
+~A
+1000.0  48.9436  2.1646
+1000.5  79.1464  2.4523
+1001.0  43.5984  -999.25
+1001.5  51.2000  2.3048
+1002.0  60.7500  2.4100
+"""
+
+@pytest.fixture
+def field(tmp_path):
+    """A base directory holding the Arroyo field with two small LAS files."""
+    field_path = tmp_path / 'Arroyo'
+    field_path.mkdir()
+    for number, name in enumerate(['Arnold 1', 'Fretz 16-1']):
+        (field_path / f"{name.replace(' ', '_')}.las").write_text(LAS_TEXT.format(name=name, number=number))
+    return tmp_path
+
+@pytest.fixture
+def manager(field):
+    manager = ProjectManager(str(field))
+    manager.selected_field = 'Arroyo'
+    return manager
+
+def expect_cache_hit(*args, **kwargs):
+    raise AssertionError("expected a cache hit")
+
+def test_warm_cache_load_does_not_parse(manager, monkeypatch):
+    manager.load_selected_field(build_wells=False, max_workers=1)
+    frames = manager.well_frames
+
+    monkeypatch.setattr(IsolatedWellLoader, 'load', expect_cache_hit)
+    manager.load_selected_field(build_wells=False, max_workers=1)
+
+    assert manager.load_errors == {}
+    assert sorted(manager.well_frames) == ['Arnold 1', 'Fretz 16-1']
+    for well_name, frame in frames.items():
+        assert manager.well_frames[well_name].equals(frame)
+
+def test_warm_eager_load_reuses_the_built_wells(manager, monkeypatch):
+    project = manager.load_selected_field(max_workers=1)
+
+    # Neither parsed nor built again
+    monkeypatch.setattr(IsolatedWellLoader, 'load', expect_cache_hit)
+    monkeypatch.setattr(project_manager, 'well_from_payload', expect_cache_hit)
+    warm_project = manager.load_selected_field(max_workers=1)
+
+    assert manager.load_errors == {}
+    assert [well.uwi for well in warm_project] == [well.uwi for well in project]
+    for well, warm_well in zip(project, warm_project):
+        assert list(warm_well.data) == list(well.data)
+        assert warm_well.data['GR'].values.tolist() == well.data['GR'].values.tolist()
+    assert sorted(manager.well_index) == ['Arnold 1', 'Fretz 16-1']
+
+def test_changed_file_is_parsed_again(manager, monkeypatch):
+    manager.load_selected_field(max_workers=1)
+    las_file = sorted(manager.las_file_list())[0]
+    with open(las_file, 'a') as f:
+        f.write("1002.5  55.0000  2.4000\n")
+
+    calls = []
+    load = IsolatedWellLoader.load
+    def counting_load(self, las_file, *args, **kwargs):
+        calls.append(os.path.basename(las_file))
+        return load(self, las_file, *args, **kwargs)
+    monkeypatch.setattr(IsolatedWellLoader, 'load', counting_load)
+    project = manager.load_selected_field(max_workers=1)
+
+    assert calls == [os.path.basename(las_file)]
+    assert sorted(len(well.data['GR'].values) for well in project) == [5, 6]
@@ -0,0 +1,85 @@
+# Benchmark of the fast ~A reader against lasio on the field LAS files.
+# Run from the code folder: python -m utils.benchmark_las_reader [base_directory] [max_files_per_field]
+
+import os
+import glob
+import sys
+import time
+import logging
+import numpy as np
+import lasio
+from utils.las_reader import read_las_fast, read_las_text, FastReadError
+
+# Silence lasio warnings about header items while timing
+logging.getLogger('lasio').setLevel(logging.ERROR)
+
+# Define the base directory where your LAS files are stored
+base_directory = sys.argv[1] if len(sys.argv) > 1 else '../data/v3.0_las_files'
+
+# Maximum number of files read per field, all files if not given
+max_files_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+def same_data(las_a, las_b):
+    """Checks that two LAS files hold the same curves and data."""
+    if [curve.mnemonic for curve in las_a.curves] != [curve.mnemonic for curve in las_b.curves]:
+        return False
+    return np.array_equal(las_a.data, las_b.data, equal_nan=True)
+
+def benchmark_field(field_path):
+    """Reads every LAS file of a field with lasio and with the fast reader.
+
+    Args:
+        field_path (str): Path of the field folder
+
+    Returns:
+        dict: Files, bytes, seconds of each reader, fallbacks and mismatches
+    """
+    las_files = sorted(glob.glob(os.path.join(field_path, '*.las')))[:max_files_per_field]
+    stats = {'Files': len(las_files), 'Bytes': 0, 'lasio': 0.0, 'fast': 0.0, 'Fallbacks': 0, 'Mismatches': []}
+
+    for las_file in las_files:
+        stats['Bytes'] += os.path.getsize(las_file)
+
+        # Time lasio's normal engine
+        start = time.perf_counter()
+        try:
+            reference = lasio.read(las_file, engine='normal')
+        except Exception:
+            reference = None
+        stats['lasio'] += time.perf_counter() - start
+
+        # Time the fast reader, counting the files it leaves to lasio
+        start = time.perf_counter()
+        text = read_las_text(las_file)
+        try:
+            if text is None:
+                raise FastReadError("Not UTF-8")
+            las = read_las_fast(text, engine='normal')
+        except FastReadError:
+            las = None
+            stats['Fallbacks'] += 1
+        stats['fast'] += time.perf_counter() - start
+
+        if las is not None and reference is not None and not same_data(las, reference):
+            stats['Mismatches'].append(os.path.basename(las_file))
+
+    return stats
+
+if __name__ == '__main__':
+    fields = sorted(name for name in os.listdir(base_directory) if os.path.isdir(os.path.join(base_directory, name)))
+    totals = {'Files': 0, 'Bytes': 0, 'lasio': 0.0, 'fast': 0.0, 'Fallbacks': 0}
+
+    print(f"{'Field':<25}{'Files':>8}{'MB':>10}{'lasio (s)':>12}{'fast (s)':>12}{'Speedup':>10}{'Fallbacks':>11}")
+    for field in fields:
+        stats = benchmark_field(os.path.join(base_directory, field))
+        if stats['Files'] == 0:
+            continue
+        for key in totals:
+            totals[key] += stats[key]
+        speedup = stats['lasio'] / stats['fast'] if stats['fast'] else float('nan')
+        print(f"{field:<25}{stats['Files']:>8}{stats['Bytes'] / 1e6:>10.1f}{stats['lasio']:>12.2f}{stats['fast']:>12.2f}{speedup:>9.1f}x{stats['Fallbacks']:>11}")
+        for las_file in stats['Mismatches']:
+            print(f"  Data differs from lasio: {las_file}")
+
+    speedup = totals['lasio'] / totals['fast'] if totals['fast'] else float('nan')
+    print(f"{'Total':<25}{totals['Files']:>8}{totals['Bytes'] / 1e6:>10.1f}{totals['lasio']:>12.2f}{totals['fast']:>12.2f}{speedup:>9.1f}x{totals['Fallbacks']:>11}")
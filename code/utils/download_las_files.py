@@ -1,12 +1,51 @@
 import csv
+import hashlib
+import http.client
 import json
 import os
+import pickle
+import random
+import socket
 import sys
-import urllib.request
+import threading
+import time
+import zipfile
 from collections import defaultdict
+from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+# Size of each chunk streamed from the socket to disk (bytes)
+CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of downloads in flight across all fields
+MAX_CONCURRENT_DOWNLOADS = 16
+
+# Number of downloads in flight when a run starts, the controller adapts it from there
+INITIAL_CONCURRENT_DOWNLOADS = 4
+
+# Number of times a transient failure (5xx, 429, dropped connection) is retried
+MAX_RETRIES = 3
+
+# Base and cap of the exponential backoff between retries (seconds)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+# HTTP statuses worth retrying, anything else (404, 403...) is final
+TRANSIENT_HTTP_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# Socket and protocol errors worth retrying, other OSErrors come from local files and are final
+NETWORK_ERRORS = (ConnectionError, TimeoutError, socket.timeout, http.client.HTTPException)
+
+# Maximum number of HTTP redirects followed for a single file
+MAX_REDIRECTS = 5
+
+# Name of the per-field manifest recording every verified download
+MANIFEST_FILENAME = 'download_manifest.json'
+
+# Suffix of the pickled LAS ID -> URL index stored next to the database file
+INDEX_SUFFIX = '.index.pkl'
 
 def get_field_las_ids(field_folder):
     """Gets a set of LAS file IDs from the LAS_*.csv file in the given field folder.
@@ -36,21 +75,16 @@ Returns:
     # Return the set of unique LAS ids        
     return las_ids
 
-def build_las_url_map(database_path, las_ids):
-    """Builds a map of LAS file IDs to download URLs.
-
-Iterates through a CSV database file containing LAS file metadata. Extracts the LAS file ID and download URL for each entry. Stores the ID->URL mapping for valid LAS IDs passed in las_ids. Also returns a list of errors for any LAS IDs missing from the database.
+def parse_las_url_database(database_path):
+    """Parses the KGS LAS database file into a map of LAS file IDs to download URLs.
 
 Args:
     database_path: Path to CSV file containing LAS metadata.
-    las_ids: Set of valid LAS IDs we want to download.
-    
-Returns: 
-    las_url_map: Dict mapping LAS IDs to download URLs
-    error_report: List of errors for any missing LAS IDs
+
+Returns:
+    dict: Mapping of every LAS ID in the database to its download URL.
 """
-    las_url_map = {}
-    error_report = []
+    las_url_index = {}
 
     # Open the database CSV file
     with open(database_path, 'r') as file:
@@ -69,47 +103,496 @@ Returns:
             url = parts[-1].strip('"')
             las_number = url.split('/')[-1].split('.')[0]
             
-            # If valid LAS ID, add to map
-            if las_number in las_ids:
-                las_url_map[las_number] = url
-                
-            # If missing from map, log error
-            elif las_number not in las_url_map and las_number in las_ids:
-                error_report.append({'LASFILE': las_number, 'Error': "No URL available"})
+            # Later lines win, as in the original per-field scan
+            las_url_index[las_number] = url
+
+    return las_url_index
+
+def load_las_url_index(database_path):
+    """Loads the LAS ID -> URL index of the database, parsing the database only when needed.
+
+The parsed index is pickled next to the database file together with the database size and
+modification time. It is reused as long as both are unchanged, so the multi-megabyte database
+is parsed once instead of once per field.
+
+Args:
+    database_path: Path to CSV file containing LAS metadata.
+
+Returns:
+    dict: Mapping of every LAS ID in the database to its download URL.
+"""
+    database_path = Path(database_path)
+    index_path = database_path.with_name(database_path.name + INDEX_SUFFIX)
+    stat = database_path.stat()
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    # Reuse the stored index if it was built from this exact database file
+    if index_path.exists():
+        try:
+            with open(index_path, 'rb') as f:
+                stored = pickle.load(f)
+            if stored.get('signature') == signature:
+                return stored['index']
+        except (pickle.UnpicklingError, EOFError, OSError, AttributeError, KeyError):
+            pass
+
+    las_url_index = parse_las_url_database(database_path)
+
+    # Store the index for later runs, a read-only data folder just means no caching
+    try:
+        temp_path = index_path.with_name(index_path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump({'signature': signature, 'index': las_url_index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, index_path)
+    except OSError:
+        pass
+
+    return las_url_index
+
+def build_las_url_map(las_url_index, las_ids, field_name):
+    """Builds a map of LAS file IDs to download URLs.
+
+Looks up each LAS ID of a field in the database index. Also returns a list of errors for any
+LAS IDs missing from the database.
+
+Args:
+    las_url_index: Dict mapping every LAS ID in the database to its URL, see load_las_url_index.
+    las_ids: Set of valid LAS IDs we want to download.
+    field_name: Name of the field, used in the error records.
+    
+Returns: 
+    las_url_map: Dict mapping LAS IDs to download URLs
+    error_report: List of errors for any missing LAS IDs
+"""
+    las_url_map = {}
+    error_report = []
+
+    for las_id in sorted(las_ids):
+        
+        # If valid LAS ID, add to map
+        if las_id in las_url_index:
+            las_url_map[las_id] = las_url_index[las_id]
+            
+        # If missing from the database, log error
+        else:
+            error_report.append({'Field': field_name, 'LASFILE': las_id, 'Error': "No URL available"})
 
     return las_url_map, error_report
 
-def download_file(las_id, url, destination_folder):
-    """Downloads a LAS file from a URL.
+class TransientDownloadError(Exception):
+    """Raised by download_file for failures that may succeed on a later attempt."""
+
+class AdaptiveConcurrencyController:
+    """Limits the number of downloads in flight and adapts the limit with AIMD.
+
+Completions are grouped in epochs of `limit` downloads. At the end of each epoch the limit is
+halved if the transient error rate exceeded error_threshold (multiplicative decrease), raised
+by one if the achieved throughput held up (additive increase), or lowered by one if the last
+increase made throughput drop.
+
+Args:
+    initial_limit: Number of downloads allowed in flight at the start.
+    min_limit: Lower bound of the limit.
+    max_limit: Upper bound of the limit, should match the thread pool size.
+    error_threshold: Fraction of failed attempts in an epoch that triggers a decrease.
+"""
+    def __init__(self, initial_limit=INITIAL_CONCURRENT_DOWNLOADS, min_limit=1, max_limit=MAX_CONCURRENT_DOWNLOADS, error_threshold=0.1):
+        self.limit = max(min_limit, min(initial_limit, max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.error_threshold = error_threshold
+        self.limit_history = [self.limit]
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._last_throughput = 0.0
+        self._reset_epoch()
+
+    def _reset_epoch(self):
+        self._epoch_start = time.monotonic()
+        self._epoch_completed = 0
+        self._epoch_errors = 0
+        self._epoch_bytes = 0
+
+    def acquire(self):
+        """Blocks until a download slot is free and takes it."""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, bytes_received=0, failed=False):
+        """Frees a download slot and feeds the outcome of the attempt to the controller.
+
+Args:
+    bytes_received: Bytes fetched over the network by the attempt.
+    failed: Whether the attempt ended in a transient error.
+"""
+        with self._condition:
+            self._in_flight -= 1
+
+            # Files skipped from the manifest say nothing about the server, only count real transfers
+            if bytes_received or failed:
+                self._epoch_completed += 1
+                self._epoch_errors += int(failed)
+                self._epoch_bytes += bytes_received
+                if self._epoch_completed >= self.limit:
+                    self._adjust()
+
+            self._condition.notify_all()
+
+    def _adjust(self):
+        elapsed = max(time.monotonic() - self._epoch_start, 1e-6)
+        throughput = self._epoch_bytes / elapsed
+        error_rate = self._epoch_errors / self._epoch_completed
+
+        # Multiplicative decrease when the server starts failing
+        if error_rate > self.error_threshold:
+            self.limit = max(self.min_limit, self.limit // 2)
+        
+        # Step back if the last increase made things slower
+        elif throughput < 0.9 * self._last_throughput:
+            self.limit = max(self.min_limit, self.limit - 1)
+
+        # Additive increase while throughput keeps up
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+
+        self._last_throughput = throughput
+        self.limit_history.append(self.limit)
+        self._reset_epoch()
+
+class ConnectionPool:
+    """Keeps one keep-alive HTTP(S) connection per host for every worker thread.
+
+Reusing the connection avoids a new TCP/TLS handshake for each LAS zip. Connections are never
+shared between threads, so no locking is needed around requests.
+
+Args:
+    timeout: Socket timeout in seconds for each connection.
+"""
+    def __init__(self, timeout=60):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._all_connections = []
+        self._lock = threading.Lock()
+
+    def _connections(self):
+        # Lazily create the connection dict of the current thread
+        if not hasattr(self._local, 'connections'):
+            self._local.connections = {}
+        return self._local.connections
+
+    def get(self, scheme, netloc):
+        """Returns the connection of the current thread for the given host, creating it if needed."""
+        connections = self._connections()
+        key = (scheme, netloc)
+
+        if key not in connections:
+            connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            connection = connection_class(netloc, timeout=self.timeout)
+            connections[key] = connection
+
+            # Keep track of every connection so they can be closed at the end
+            with self._lock:
+                self._all_connections.append(connection)
+
+        return connections[key]
+
+    def discard(self, scheme, netloc):
+        """Closes and forgets the connection of the current thread for the given host."""
+        connection = self._connections().pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def close_all(self):
+        """Closes every connection opened by the pool."""
+        with self._lock:
+            for connection in self._all_connections:
+                connection.close()
+            self._all_connections.clear()
+
+def open_url(pool, url, headers=None):
+    """Sends a GET request through the pool and returns the open response.
+
+Redirects are followed up to MAX_REDIRECTS times. A stale keep-alive connection (closed by the
+server between requests) is retried once on a fresh connection.
+
+Args:
+    pool: ConnectionPool used to get the connection for the URL host.
+    url: The URL to request.
+    headers: Optional dict of extra request headers.
+
+Returns:
+    http.client.HTTPResponse: The response, with the body still unread.
+"""
+    headers = dict(headers or {})
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        # Retry once if the server dropped the idle keep-alive connection
+        for attempt in range(2):
+            connection = pool.get(parts.scheme, parts.netloc)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                pool.discard(parts.scheme, parts.netloc)
+                if attempt == 1:
+                    raise
+
+        # Follow redirects, draining the body so the connection can be reused
+        if response.status in (301, 302, 303, 307, 308) and response.getheader('Location'):
+            response.read()
+            url = urljoin(url, response.getheader('Location'))
+            continue
+
+        return response
+
+    raise http.client.HTTPException(f"Too many redirects for {url}")
+
+def load_manifest(field_destination):
+    """Loads the download manifest of a field folder.
+
+Args:
+    field_destination: Path to the field folder holding the downloaded zips.
+
+Returns:
+    dict: Mapping of LAS ID to {'size', 'mtime_ns', 'sha256', 'timestamp'}, empty if there is no manifest yet.
+"""
+    manifest_path = Path(field_destination) / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return {}
+
+    # A corrupt manifest only costs a re-verification, never a crash
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+def save_manifest(field_destination, manifest):
+    """Writes the download manifest of a field folder atomically.
+
+Args:
+    field_destination: Path to the field folder holding the downloaded zips.
+    manifest: Mapping of LAS ID to its download record.
+"""
+    manifest_path = Path(field_destination) / MANIFEST_FILENAME
+    temp_path = manifest_path.with_name(MANIFEST_FILENAME + '.tmp')
+
+    # Write to a temporary file and rename so a killed run never leaves half a manifest
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+def file_sha256(file_path):
+    """Returns the hex SHA-256 digest of a file, read in chunks."""
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+def make_manifest_record(zip_path, sha256):
+    """Builds the manifest record of a verified zip, with the size and mtime it was verified at."""
+    stat = os.stat(zip_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256, 'timestamp': datetime.now().isoformat(timespec='seconds')}
+
+def download_file(las_id, url, destination_folder, pool, record=None, verify=False):
+    """Downloads a LAS file from a URL, streaming it to disk in chunks.
+
+The file is written to <las_id>.zip.part and renamed to <las_id>.zip only once complete. If a
+.part file is left over from an interrupted run, the download resumes with an HTTP Range request.
+A zip listed in the manifest with the same size and mtime is skipped without being read. If its
+mtime changed, or with verify, its SHA-256 is checked against the manifest and it is fetched again
+on a mismatch.
 
 Args:
     las_id: The LAS file ID 
     url: The URL to download the LAS file from
     destination_folder: The folder to save the downloaded file
+    pool: ConnectionPool providing keep-alive connections
+    record: The manifest record of this LAS ID from a previous run, if any
+    verify: Check the SHA-256 of a zip listed in the manifest even if it looks unchanged
 
 Returns:
     las_id: The LAS file ID
     error: Any error message if the download failed, else None
+    record: The manifest record of the verified file, else None
+    bytes_received: Number of bytes fetched over the network
+
+Raises:
+    TransientDownloadError: On 5xx/429 responses, dropped connections and truncated bodies.
+    OSError: On local file errors, such as a full disk or a .part file that cannot be written.
 """
-    # Construct the filename for the zip file
+    # Construct the filename for the zip file and its partial download
     zip_filename = f"{las_id}.zip"  
     zip_path = destination_folder / zip_filename
+    part_path = destination_folder / f"{zip_filename}.part"
 
     # Check if the file already exists locally
     if os.path.exists(zip_path):
-        return las_id, "File already exists"
+        
+        # Verified by a previous run and untouched since, nothing to do
+        stat = os.stat(zip_path)
+        if record and stat.st_size == record['size']:
+            if not verify and stat.st_mtime_ns == record.get('mtime_ns'):
+                return las_id, None, record, 0
+
+            # Touched since, or asked to, keep it only if it still holds the verified bytes
+            sha256 = file_sha256(zip_path)
+            if sha256 == record['sha256']:
+                return las_id, None, make_manifest_record(zip_path, sha256), 0
+
+        # Unknown file from an older run, keep it if it is a readable zip
+        if not record and zipfile.is_zipfile(zip_path):
+            return las_id, None, make_manifest_record(zip_path, file_sha256(zip_path)), 0
+
+        # Broken file, fetch it again
+        os.remove(zip_path)
 
     try:
-        # Download the file contents from the URL
-        with urllib.request.urlopen(url) as response, open(zip_path, 'wb') as out_file:
-            out_file.write(response.read())
-        
-        # Return the LAS ID and no error
-        return las_id, None
+        # Resume from the partial file if there is one
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        response = open_url(pool, url, headers)
+
+        # The partial file already holds the whole body
+        if response.status == 416 and zipfile.is_zipfile(part_path):
+            response.read()
+            os.replace(part_path, zip_path)
+            return las_id, None, make_manifest_record(zip_path, file_sha256(zip_path)), 0
+
+        # Range not honoured or not satisfiable, start over from scratch
+        if response.status in (200, 416) and offset:
+            if response.status == 416:
+                response.read()
+                response = open_url(pool, url)
+            offset = 0
+
+        # Anything other than 200/206 is an error, drain the body to keep the connection alive
+        if response.status not in (200, 206):
+            response.read()
+            message = f"Error downloading {url}: HTTP Error {response.status}: {response.reason}"
+            if response.status in TRANSIENT_HTTP_STATUSES:
+                raise TransientDownloadError(message)
+            return las_id, message, None, 0
+
+        # Hash what is already on disk before appending to it
+        sha256 = hashlib.sha256()
+        if offset:
+            with open(part_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+
+        # Stream the file contents to disk chunk by chunk
+        expected_length = response.getheader('Content-Length')
+        received = 0
+        with open(part_path, 'ab' if offset else 'wb') as out_file:
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                out_file.write(chunk)
+                sha256.update(chunk)
+                received += len(chunk)
+
+        # Keep the partial file to resume from if the body was cut short
+        if expected_length is not None and received != int(expected_length):
+            raise TransientDownloadError(f"Error downloading {url}: incomplete body ({received} of {expected_length} bytes)")
+
+        # Move the completed file into place atomically
+        os.replace(part_path, zip_path)
+
+        # Return the LAS ID, no error, the manifest record and the bytes fetched
+        return las_id, None, make_manifest_record(zip_path, sha256.hexdigest()), received
+
+    except TransientDownloadError:
+        parts = urlsplit(url)
+        pool.discard(parts.scheme, parts.netloc)
+        raise
+
+    except NETWORK_ERRORS as e:
+        # Drop the connection, its state is unknown after a failure
+        parts = urlsplit(url)
+        pool.discard(parts.scheme, parts.netloc)
+
+        # Network failures are worth another attempt
+        raise TransientDownloadError(f"Error downloading {url}: {e}") from e
+
+    except OSError:
+        # Local file errors (disk full, permissions) will not go away on retry, stop right here
+        parts = urlsplit(url)
+        pool.discard(parts.scheme, parts.netloc)
+        raise
         
     except Exception as e:
+        # Drop the connection, its state is unknown after a failure
+        parts = urlsplit(url)
+        pool.discard(parts.scheme, parts.netloc)
+
         # Return the LAS ID and the error message
-        return las_id, f"Error downloading {url}: {e}"
+        return las_id, f"Error downloading {url}: {e}", None, 0
+
+def download_file_with_retries(las_id, url, destination_folder, pool, controller, record=None, max_retries=MAX_RETRIES, verify=False):
+    """Downloads a LAS file through the concurrency controller, retrying transient failures.
+
+Each attempt holds a controller slot only while it runs. Between attempts the worker sleeps a
+random delay up to BACKOFF_BASE * 2**attempt seconds (full jitter, capped at BACKOFF_MAX), and
+the next attempt resumes from the .part file left by the previous one.
+
+Args:
+    las_id: The LAS file ID 
+    url: The URL to download the LAS file from
+    destination_folder: The folder to save the downloaded file
+    pool: ConnectionPool providing keep-alive connections
+    controller: AdaptiveConcurrencyController shared by all downloads
+    record: The manifest record of this LAS ID from a previous run, if any
+    max_retries: Number of retries after the first attempt
+    verify: Check the SHA-256 of a zip listed in the manifest even if it looks unchanged
+
+Returns:
+    las_id: The LAS file ID
+    error: Any error message if the download failed, else None
+    record: The manifest record of the verified file, else None
+    stats: Dict with the bytes fetched, seconds spent downloading and number of attempts
+
+Raises:
+    OSError: On local file errors, which are not retried.
+"""
+    stats = {'bytes': 0, 'seconds': 0.0, 'attempts': 0}
+
+    for attempt in range(max_retries + 1):
+        controller.acquire()
+        start = time.monotonic()
+        stats['attempts'] += 1
+        try:
+            las_id, error, record, bytes_received = download_file(las_id, url, destination_folder, pool, record, verify)
+        except TransientDownloadError as e:
+            stats['seconds'] += time.monotonic() - start
+            controller.release(failed=True)
+
+            # Out of attempts, report the last error
+            if attempt == max_retries:
+                return las_id, f"{e} (after {stats['attempts']} attempts)", None, stats
+
+            # Back off with full jitter before trying again
+            time.sleep(random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)))
+            continue
+        except BaseException:
+            # Free the slot before a local error stops the run
+            controller.release()
+            raise
+
+        stats['seconds'] += time.monotonic() - start
+        stats['bytes'] += bytes_received
+        controller.release(bytes_received=bytes_received)
+        return las_id, error, record, stats
 
 def print_progress_bar(iteration, total, field_name, max_field_length, length=50):
     """Prints a progress bar showing the progress of iterating through a total number of items.
@@ -163,19 +646,27 @@ Args:
     if iteration == total:
         print()
 
-def download_and_organize_las_files(source_folder, destination_folder, database_path):
+def download_and_organize_las_files(source_folder, destination_folder, database_path, max_workers=MAX_CONCURRENT_DOWNLOADS, max_retries=MAX_RETRIES, verify=False):
     """Downloads LAS files for multiple fields from a source folder, 
 organizes them by field in a destination folder, and logs any errors.
 
+All fields share one thread pool and each worker thread reuses its keep-alive connection to the
+KGS server. The number of downloads in flight is adapted between 1 and max_workers by an
+AdaptiveConcurrencyController, and transient failures are retried with jittered backoff.
+
 Args:
   source_folder: Path to folder containing field subfolders with LAS files
   destination_folder: Path to folder to save organized LAS files
   database_path: Path to database file with LAS file URLs
+  max_workers: Maximum number of concurrent downloads across all fields
+  max_retries: Number of retries for each transient failure
+  verify: Check the SHA-256 of every zip listed in the manifests, fetching the corrupt ones again
   
 Returns:
   None
   
-Generates a JSON error report in reports/error_report.json with any errors.
+Generates a JSON error report in reports/01_downloading_error_report.json with any errors,
+and per-file bytes, seconds and attempts in reports/01_downloading_stats.json.
 """
     # Set up source and destination paths
     source_path = Path(source_folder) 
@@ -187,51 +678,103 @@ Generates a JSON error report in reports/error_report.json with any errors.
     # Initialize error report
     error_report = []
 
-    # Get max field name length for progress bar
-    max_field_name_length = max(len(field_folder.name) for field_folder in source_path.iterdir() if field_folder.is_dir())
+    # Parse the database once for all fields
+    las_url_index = load_las_url_index(database_path)
 
-    # Loop through each field folder
-    for field_folder in source_path.iterdir():
+    # Collect the download tasks of every field before starting
+    tasks = []
+    manifests = {}
+    for field_folder in sorted(source_path.iterdir()):
         if field_folder.is_dir():
             
             # Get field name
             field_name = field_folder.name
             
             # Make field folder in destination
-            #field_name = field_folder.name.replace('-', ' ').title().replace(' ', '')
             field_destination = destination_path / field_name
             field_destination.mkdir(exist_ok=True)
 
+            # Load the records of files verified by previous runs
+            manifests[field_name] = load_manifest(field_destination)
+
             # Get list of LAS ids for this field
             las_ids = get_field_las_ids(field_folder)
             
             # Get dict mapping LAS ids to URLs
-            las_url_map, field_error_report = build_las_url_map(database_path, las_ids)
+            las_url_map, field_error_report = build_las_url_map(las_url_index, las_ids, field_name)
             
             # Add any errors to main error report
             error_report.extend(field_error_report)
 
-            # Get total files to download
-            total_files = len(las_url_map)
-            
-            # Track files downloaded
-            files_downloaded = 0
+            for las_id, url in las_url_map.items():
+                tasks.append((field_name, las_id, url, field_destination))
+
+    # Get total files to download
+    total_files = len(tasks)
+    
+    # Track files downloaded, and files still pending per field to know when a manifest can be saved
+    files_downloaded = 0
+    pending_by_field = defaultdict(int)
+    for field_name, _, _, _ in tasks:
+        pending_by_field[field_name] += 1
+    field_destinations = {field_name: field_destination for field_name, _, _, field_destination in tasks}
+    dirty_fields = set()
+
+    # Get max field name length for progress bar
+    max_field_name_length = max((len(task[0]) for task in tasks), default=0)
+
+    # Track per-file transfer statistics
+    download_stats = []
+    run_start = time.monotonic()
+
+    # Use one threadpool for all fields, the controller decides how many threads may download at once
+    pool = ConnectionPool()
+    controller = AdaptiveConcurrencyController(max_limit=max_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(download_file_with_retries, las_id, url, field_destination, pool, controller, manifests[field_name].get(las_id), max_retries, verify): field_name
+                for field_name, las_id, url, field_destination in tasks
+            }
             
-            # Use threadpool to download files asynchronously 
-            with ProcessPoolExecutor(max_workers=25) as executor:
-                futures = {executor.submit(download_file, las_id, url, field_destination): las_id for las_id, url in las_url_map.items()}
+            # Process results as downloads complete
+            for future in as_completed(futures):
+                field_name = futures[future]
+                las_id, error, record, stats = future.result()
+                files_downloaded += 1
+
+                # Keep the stats of files that actually went over the network
+                if stats['bytes'] or stats['attempts'] > 1:
+                    download_stats.append({'Field': field_name, 'LASFILE': las_id, 'Bytes': stats['bytes'], 'Seconds': round(stats['seconds'], 3), 'Attempts': stats['attempts']})
+                
+                # Print progress bar
+                print_progress_bar(files_downloaded, total_files, field_name, max_field_name_length)
                 
-                # Process results as downloads complete
-                for future in as_completed(futures):
-                    las_id, error = future.result()
-                    files_downloaded += 1
-                    
-                    # Print progress bar
-                    print_progress_bar(files_downloaded, total_files, field_name, max_field_name_length)
-                    
-                    # Add any errors to report
-                    if error:
-                        error_report.append({'Field': field_name, 'LASFILE': las_id, 'Error': error})
+                # Add any errors to report, and forget files that are no longer verified
+                if error:
+                    error_report.append({'Field': field_name, 'LASFILE': las_id, 'Error': error})
+                    if manifests[field_name].pop(las_id, None) is not None:
+                        dirty_fields.add(field_name)
+                elif manifests[field_name].get(las_id) != record:
+                    manifests[field_name][las_id] = record
+                    dirty_fields.add(field_name)
+
+                # Save the field manifest as soon as the field is done
+                pending_by_field[field_name] -= 1
+                if pending_by_field[field_name] == 0 and field_name in dirty_fields:
+                    save_manifest(field_destinations[field_name], manifests[field_name])
+                    dirty_fields.discard(field_name)
+    finally:
+        pool.close_all()
+
+        # Keep the progress of interrupted fields so the next run can skip them
+        for field_name in dirty_fields:
+            save_manifest(field_destinations[field_name], manifests[field_name])
+
+    # Summarize the achieved throughput
+    run_seconds = time.monotonic() - run_start
+    total_bytes = sum(stat['Bytes'] for stat in download_stats)
+    throughput_mb_s = total_bytes / (1024 ** 2) / run_seconds if run_seconds > 0 else 0.0
 
     # Initialize a dictionary to group errors by field
     errors_grouped_by_field = defaultdict(list)
@@ -253,13 +796,24 @@ Generates a JSON error report in reports/error_report.json with any errors.
         # Convert the defaultdict to a regular dict for JSON serialization
         json.dump(dict(errors_grouped_by_field), f, indent=4)
 
+    # Save the transfer statistics of the run
+    stats_file = reports_path / '01_downloading_stats.json'
+    with open(stats_file, 'w') as f:
+        json.dump({
+            'Summary': {
+                'Files': len(download_stats),
+                'Bytes': total_bytes,
+                'Seconds': round(run_seconds, 3),
+                'MB/s': round(throughput_mb_s, 3),
+                'ConcurrencyHistory': controller.limit_history,
+            },
+            'Files': download_stats,
+        }, f, indent=4)
+
     # Print message on completion
     blue = '\033[94m'
     reset = '\033[0m'
     error_report_file = Path('reports/01_downloading_error_report.json')
 
+    print(f"Downloaded {total_bytes / (1024 ** 2):.1f} MB at {throughput_mb_s:.2f} MB/s (final concurrency {controller.limit}).")
     print(f"Download process completed. Please check '{blue}{error_report_file}{reset}' for details.")
-
-
-
-
@@ -0,0 +1,169 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Data type of the curves that it holds exactly, half the size of the float64 curves
+FIELD_STORE_DTYPE = np.float32
+
+# Data type of the depth index and of the curves float32 would round, so the store never changes a value
+FIELD_STORE_EXACT_DTYPE = np.float64
+
+# Byte alignment of each array in the data file, so every view of the memory map is aligned
+FIELD_STORE_ALIGNMENT = 8
+
+class FieldCurveStore:
+    """
+    Read-only view of a field store: the depth index and curves of every well of a field laid
+    out one after the other in a single file, opened as a memory map, plus an offset table
+    {well name: {curve name: [byte offset, length, dtype]}}. The depth index is float64, the
+    curves float32 when that holds their values exactly, else float64.
+
+    Curves are returned as views of the memory map, so processes that open the same store share
+    its pages. Pickling a store only sends its path and offset table, the receiving process maps
+    the file again. Workers that need a few curves get their (path, byte offset, length, dtype) slices
+    instead, see curve_slice and read_curve_slice.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path + '.json', 'r') as f:
+            table = json.load(f)
+        self.wells = table['wells']
+        self.index_names = table['index_names']
+        self.data = self.open_data()
+
+    def open_data(self):
+        """Maps the data file read-only, an empty store has no file to map."""
+        if os.path.getsize(self.path) == 0:
+            return np.empty(0, dtype=np.uint8)
+        return np.memmap(self.path, dtype=np.uint8, mode='r')
+
+    def __getstate__(self):
+        return {'path': self.path, 'wells': self.wells, 'index_names': self.index_names}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.data = self.open_data()
+
+    def __contains__(self, well_name):
+        return well_name in self.wells
+
+    def curves(self, well_name):
+        """Curve names of a well, without its depth index."""
+        return [curve for curve in self.wells[well_name] if curve != self.index_names[well_name]]
+
+    def curve(self, well_name, curve):
+        """
+        Returns a curve of a well as a view of the store.
+
+        Args:
+            well_name (str): Lease name of the well.
+            curve (str): Curve mnemonic.
+
+        Returns:
+            np.ndarray: Read-only view, or None if the well has no such curve.
+        """
+        entry = self.wells.get(well_name, {}).get(curve)
+        if entry is None:
+            return None
+        offset, length, dtype = entry
+        return self.data[offset:offset + length * np.dtype(dtype).itemsize].view(dtype)
+
+    def curve_slice(self, well_name, curve):
+        """
+        Returns where a curve lies in the store, for workers that should not receive the
+        whole offset table.
+
+        Returns:
+            tuple: (path, byte offset, length, dtype), or None if the well has no such curve.
+        """
+        entry = self.wells.get(well_name, {}).get(curve)
+        if entry is None:
+            return None
+        return (self.path,) + tuple(entry)
+
+    def depth(self, well_name):
+        """Returns the depth index of a well as a view of the store."""
+        return self.curve(well_name, self.index_names[well_name])
+
+    def frame(self, well_name, curves=None):
+        """
+        Builds the depth-indexed DataFrame of some curves of a well, copying only those curves.
+
+        Args:
+            well_name (str): Lease name of the well.
+            curves (list): Curve mnemonics, all the curves of the well if None.
+
+        Returns:
+            pd.DataFrame: The curves present in the well, indexed by depth.
+        """
+        curves = self.curves(well_name) if curves is None else [curve for curve in curves if curve in self.wells[well_name]]
+        index = pd.Index(np.array(self.depth(well_name)), name=self.index_names[well_name])
+        return pd.DataFrame({curve: np.array(self.curve(well_name, curve)) for curve in curves}, index=index)
+
+def read_curve_slice(curve_slice):
+    """
+    Maps one curve of a field store read-only, from its (path, byte offset, length, dtype).
+
+    Args:
+        curve_slice (tuple): (path, byte offset, length, dtype), see FieldCurveStore.curve_slice
+
+    Returns:
+        np.ndarray: Read-only view of the curve
+    """
+    path, offset, length, dtype = curve_slice
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(length,))
+
+def exact_store_dtype(values):
+    """Returns FIELD_STORE_DTYPE if it holds every value of a float64 curve exactly, else FIELD_STORE_EXACT_DTYPE."""
+    narrowed = values.astype(FIELD_STORE_DTYPE)
+    if np.array_equal(narrowed.astype(FIELD_STORE_EXACT_DTYPE), values, equal_nan=True):
+        return FIELD_STORE_DTYPE
+    return FIELD_STORE_EXACT_DTYPE
+
+def write_field_store(well_frames, path):
+    """
+    Writes the depth index and numeric curves of every well of a field to a field store.
+
+    The curves are written one after the other to the data file at path, and the offset table
+    to path + '.json', both atomically. The depth index is written as float64, and each curve as
+    float32 only if that does not round any of its values, so statistics and outliers computed
+    from the store match the ones computed from the curve tables.
+
+    Args:
+        well_frames (dict): {well name: depth-indexed curve DataFrame}
+        path (str): Path of the data file
+
+    Returns:
+        FieldCurveStore: The store, opened read-only
+    """
+    wells = {}
+    index_names = {}
+    offset = 0
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for well_name, well_df in well_frames.items():
+            index_name = well_df.index.name or 'DEPT'
+            columns = [(index_name, well_df.index)] + [(curve, well_df[curve]) for curve in well_df.columns if pd.api.types.is_numeric_dtype(well_df[curve])]
+            wells[well_name] = {}
+            index_names[well_name] = index_name
+            for curve, values in columns:
+                values = np.asarray(values, dtype=FIELD_STORE_EXACT_DTYPE)
+                if curve != index_name:
+                    values = values.astype(exact_store_dtype(values))
+                values.tofile(f)
+                wells[well_name][curve] = [offset, len(values), values.dtype.str]
+                offset += values.nbytes
+
+                # Pad to the next aligned offset
+                padding = -offset % FIELD_STORE_ALIGNMENT
+                f.write(b'\0' * padding)
+                offset += padding
+    os.replace(tmp_path, path)
+
+    with open(path + '.json.tmp', 'w') as f:
+        json.dump({'wells': wells, 'index_names': index_names}, f)
+    os.replace(path + '.json.tmp', path + '.json')
+    return FieldCurveStore(path)
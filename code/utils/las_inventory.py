@@ -0,0 +1,222 @@
+import os
+import sqlite3
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from utils.las_reader import read_las_header
+
+# SQLite catalog of the header information of every LAS file, written at the root of the LAS folder
+CATALOG_FILENAME = 'las_catalog.sqlite'
+
+# Tables of the catalog, all keyed by (field, file)
+CATALOG_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    field TEXT NOT NULL,
+    file TEXT NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    lease TEXT,
+    kid TEXT,
+    strt REAL,
+    stop REAL,
+    step REAL,
+    null_value REAL,
+    index_unit TEXT,
+    error TEXT,
+    PRIMARY KEY (field, file)
+);
+CREATE TABLE IF NOT EXISTS curves (
+    field TEXT NOT NULL,
+    file TEXT NOT NULL,
+    position INTEGER,
+    mnemonic TEXT,
+    unit TEXT,
+    value TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS header_items (
+    field TEXT NOT NULL,
+    file TEXT NOT NULL,
+    section TEXT,
+    mnemonic TEXT,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS formations (
+    field TEXT NOT NULL,
+    file TEXT NOT NULL,
+    formation TEXT,
+    top REAL,
+    base REAL
+);
+CREATE INDEX IF NOT EXISTS curves_mnemonic ON curves (mnemonic);
+CREATE INDEX IF NOT EXISTS curves_file ON curves (field, file);
+CREATE INDEX IF NOT EXISTS header_items_file ON header_items (field, file);
+CREATE INDEX IF NOT EXISTS formations_file ON formations (field, file);
+'''
+
+# Number of files sent to a scan worker at once
+SCAN_CHUNK_SIZE = 32
+
+def parse_formation_tops(other_text):
+    """Parses the BASE,TOP,FORMATION lines written to the ~Other section by LASFileProcessor.
+
+    Args:
+        other_text (str): Text of the ~Other section
+
+    Returns:
+        list: {'formation', 'top', 'base'} dicts sorted by top depth, base is None when missing
+    """
+    formations = []
+    for line in other_text.splitlines():
+        parts = line.strip().split(',')
+        if len(parts) != 3 or parts[0].strip().lower() == 'base':
+            continue
+        base, top, formation = parts
+        try:
+            base = float(base) if base.strip().lower() != 'nan' else None
+            top = float(top) if top.strip().lower() != 'nan' else None
+        except ValueError:
+            continue
+        if top is not None:
+            formations.append({'formation': formation.strip(), 'top': top, 'base': base})
+    formations.sort(key=lambda x: x['top'])
+    return formations
+
+def header_value(las, section, mnemonic):
+    """Returns the value of a header item, or None if the section has no such item."""
+    items = las.sections.get(section)
+    if items is None or mnemonic not in items:
+        return None
+    value = items[mnemonic].value
+    return value.item() if hasattr(value, 'item') else value
+
+def scan_las_header(task):
+    """Reads the header sections of one LAS file into a catalog record.
+
+    Args:
+        task (tuple): (field name, path of the LAS file, size, mtime_ns)
+
+    Returns:
+        dict: Catalog record of the file, with an 'error' entry if the header cannot be read
+    """
+    field_name, las_file, size, mtime_ns = task
+    record = {'field': field_name, 'file': os.path.basename(las_file), 'size': size, 'mtime_ns': mtime_ns}
+    try:
+        las = read_las_header(las_file)
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+        return record
+
+    record.update({
+        'lease': header_value(las, 'Well', 'LEASE'),
+        'kid': header_value(las, 'Well', 'KID'),
+        'strt': header_value(las, 'Well', 'STRT'),
+        'stop': header_value(las, 'Well', 'STOP'),
+        'step': header_value(las, 'Well', 'STEP'),
+        'null': header_value(las, 'Well', 'NULL'),
+        'index_unit': las.index_unit,
+        'header_items': [(section, item.mnemonic, str(item.value)) for section in ('Version', 'Well', 'Parameter') for item in las.sections.get(section, [])],
+        'curves': [{'mnemonic': curve.mnemonic, 'unit': curve.unit, 'value': str(curve.value), 'description': curve.descr} for curve in las.curves],
+        'formations': parse_formation_tops(las.other),
+    })
+    return record
+
+def catalog_path(base_directory):
+    """Path of the catalog of a LAS folder."""
+    return os.path.join(base_directory, CATALOG_FILENAME)
+
+def connect_catalog(base_directory):
+    """Opens the catalog of a LAS folder, creating its tables if needed.
+
+    Args:
+        base_directory (str): Folder with one subfolder of LAS files per field
+
+    Returns:
+        sqlite3.Connection: Connection to the catalog
+    """
+    connection = sqlite3.connect(catalog_path(base_directory))
+    connection.executescript(CATALOG_SCHEMA)
+    return connection
+
+def write_catalog_record(connection, record):
+    """Inserts the rows of one file record into the catalog."""
+    key = (record['field'], record['file'])
+    connection.execute(
+        'INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        key + (record['size'], record['mtime_ns'], record.get('lease'), None if record.get('kid') is None else str(record['kid']),
+               record.get('strt'), record.get('stop'), record.get('step'), record.get('null'), record.get('index_unit'), record.get('error')))
+    connection.executemany(
+        'INSERT INTO curves VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [key + (i, curve['mnemonic'], curve['unit'], curve['value'], curve['description']) for i, curve in enumerate(record.get('curves', []))])
+    connection.executemany('INSERT INTO header_items VALUES (?, ?, ?, ?, ?)', [key + item for item in record.get('header_items', [])])
+    connection.executemany(
+        'INSERT INTO formations VALUES (?, ?, ?, ?, ?)',
+        [key + (formation['formation'], formation['top'], formation['base']) for formation in record.get('formations', [])])
+
+def delete_catalog_files(connection, keys):
+    """Deletes the rows of the given (field, file) keys from every table of the catalog."""
+    for table in ('files', 'curves', 'header_items', 'formations'):
+        connection.executemany(f'DELETE FROM {table} WHERE field = ? AND file = ?', keys)
+
+def scan_las_inventory(base_directory, max_workers=None):
+    """Builds or refreshes the catalog of every LAS file of every field from their headers only.
+
+    Each file is read up to its ~A line, so no curve data is parsed. Files whose size and
+    modification time match the catalog are not read again, files that disappeared are
+    removed, and the headers of the new or changed files of all fields are read by one
+    process pool.
+
+    Args:
+        base_directory (str): Folder with one subfolder of LAS files per field
+        max_workers (int): Number of scan processes, the number of CPUs by default
+
+    Returns:
+        str: Path of the catalog
+    """
+    with contextlib.closing(connect_catalog(base_directory)) as connection:
+        catalogued = {(field, file): (size, mtime_ns) for field, file, size, mtime_ns in connection.execute('SELECT field, file, size, mtime_ns FROM files')}
+
+        current = set()
+        tasks = []
+        fields = sorted(name for name in os.listdir(base_directory) if os.path.isdir(os.path.join(base_directory, name)))
+        for field_name in fields:
+            field_path = os.path.join(base_directory, field_name)
+            for file_name in sorted(os.listdir(field_path)):
+                if not file_name.lower().endswith('.las'):
+                    continue
+                las_file = os.path.join(field_path, file_name)
+                stat = os.stat(las_file)
+                current.add((field_name, file_name))
+
+                # Read again only new or changed files
+                if catalogued.get((field_name, file_name)) != (stat.st_size, stat.st_mtime_ns):
+                    tasks.append((field_name, las_file, stat.st_size, stat.st_mtime_ns))
+
+        removed = [key for key in catalogued if key not in current]
+        with connection:
+            delete_catalog_files(connection, removed + [(field_name, os.path.basename(las_file)) for field_name, las_file, _, _ in tasks])
+            if tasks:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for record in executor.map(scan_las_header, tasks, chunksize=SCAN_CHUNK_SIZE):
+                        write_catalog_record(connection, record)
+
+    print(f"LAS catalog: {len(current)} files in {len(fields)} fields, {len(tasks)} headers read, {len(removed)} removed.")
+    return catalog_path(base_directory)
+
+def query_catalog(base_directory, query, params=()):
+    """Runs a SQL query on the catalog of a LAS folder.
+
+    Args:
+        base_directory (str): Folder with one subfolder of LAS files per field
+        query (str): SQL query on the files, curves, header_items and formations tables
+        params (tuple): Parameters of the query
+
+    Returns:
+        pd.DataFrame: Result of the query
+    """
+    with contextlib.closing(connect_catalog(base_directory)) as connection:
+        return pd.read_sql_query(query, connection, params=params)
+
+# # Example of use
+# scan_las_inventory('../data/v3.0_las_files')
+# query_catalog('../data/v3.0_las_files', "SELECT field, COUNT(*) AS wells FROM files GROUP BY field")
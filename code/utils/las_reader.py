@@ -0,0 +1,266 @@
+import re
+import numpy as np
+import pandas as pd
+import lasio
+
+# Line that opens the ~A (ASCII data) section
+DATA_SECTION_PATTERN = re.compile(r'^[ \t]*~A[^\n]*(?:\n|$)', re.MULTILINE)
+
+# Header item of the ~Well section that tags a salvaged LAS file with its repair report
+REPAIR_MNEMONIC = 'REPAIR'
+
+class FastReadError(ValueError):
+    """Raised when a LAS file cannot be parsed by the fast reader and has to be read by lasio."""
+
+def split_las_text(text):
+    """Splits the contents of a LAS file into the header sections and the ~A data.
+
+    Args:
+        text (str): Contents of the LAS file
+
+    Returns:
+        tuple: (header_text, data_text), the header including the ~A line and the data lines after it
+    """
+    match = DATA_SECTION_PATTERN.search(text)
+    if match is None:
+        raise FastReadError("No ~A section found")
+    if not text[:match.start()].strip():
+        raise FastReadError("No header sections before the ~A section")
+    return text[:match.end()], text[match.end():]
+
+def parse_data_section(data_text, n_columns):
+    """Parses the ~A data lines into a 2D float array in one shot.
+
+    Args:
+        data_text (str): The lines after the ~A line
+        n_columns (int): Number of curves defined in the ~C section
+
+    Returns:
+        np.ndarray: 2D float array, rows are depth steps and columns are curves
+    """
+    # Sections after ~A, comments and delimiters other than whitespace are left to lasio
+    if '~' in data_text or '#' in data_text or ',' in data_text:
+        raise FastReadError("Unsupported content in the ~A section")
+
+    try:
+        values = np.array(data_text.split(), dtype=np.float64)
+    except ValueError:
+        raise FastReadError("Non-numeric values in the ~A section")
+
+    # Every non-blank line must hold exactly one value per curve
+    n_rows = sum(map(bool, map(str.strip, data_text.splitlines())))
+    if n_columns == 0 or values.size != n_rows * n_columns:
+        raise FastReadError(f"~A section does not have {n_columns} values per line")
+    return values.reshape(n_rows, n_columns)
+
+def read_las_fast(text, **kwargs):
+    """Reads the contents of a LAS file, parsing the ~A section with NumPy.
+
+    The header sections (~Version, ~Well, ~Curves, ~Parameter and ~Other) are parsed by
+    lasio with ignore_data=True, then the ~A section is parsed in one shot and assigned
+    to the curves. The NULL value is replaced by NaN in every curve but the index, as
+    lasio does.
+
+    Args:
+        text (str): Contents of the LAS file
+        **kwargs: Keyword arguments of lasio.read used for the header sections
+
+    Returns:
+        lasio.LASFile: The LAS file, equivalent to lasio.read(text)
+
+    Raises:
+        FastReadError: If the file is wrapped, not LAS 1.2/2.0 or its ~A section is malformed
+    """
+    header_text, data_text = split_las_text(text)
+    las = lasio.read(header_text, ignore_data=True, **kwargs)
+
+    # Wrapped and LAS 3.0 files are left to lasio
+    if 'WRAP' in las.version and str(las.version['WRAP'].value).strip().upper() == 'YES':
+        raise FastReadError("Wrapped LAS file")
+    if 'VERS' in las.version and str(las.version['VERS'].value).strip().startswith('3'):
+        raise FastReadError("LAS 3.0 file")
+
+    data = parse_data_section(data_text, len(las.curves))
+
+    replace_null_values(las, data)
+    for i, curve in enumerate(las.curves):
+        curve.data = data[:, i].copy()
+    las.index_initial = las.index.copy()
+    return las
+
+def replace_null_values(las, data):
+    """Replaces the NULL value of the ~Well section by NaN in every curve but the index, as lasio does."""
+    if 'NULL' not in las.well:
+        return
+    try:
+        null_value = float(las.well['NULL'].value)
+    except (TypeError, ValueError):
+        return
+    curves_data = data[:, 1:]
+    curves_data[curves_data == null_value] = np.nan
+
+def salvage_las(text, **kwargs):
+    """Reads the contents of a LAS file whose ~A section cannot be parsed as is, repairing what it can.
+
+    Repairs, each described in the returned report:
+      - Wrapped data, declared by WRAP YES or detected from lines that add up to whole depth steps, is unwrapped
+      - Lines whose number of values differs from the rest (ragged or truncated rows) are dropped
+      - When the ~A lines hold a different number of columns than the ~C section defines, the
+        curves without data or the columns without a curve are dropped
+      - Non-numeric values are replaced by NaN
+
+    Args:
+        text (str): Contents of the LAS file
+        **kwargs: Keyword arguments of lasio.read used for the header sections
+
+    Returns:
+        tuple: (las, repairs), the lasio.LASFile with consistent data and the list of repairs made
+
+    Raises:
+        FastReadError: If the file has no header or no data left to salvage
+    """
+    header_text, data_text = split_las_text(text)
+    las = lasio.read(header_text, ignore_data=True, **kwargs)
+    n_curves = len(las.curves)
+    if n_curves == 0:
+        raise FastReadError("No curves defined in the ~C section")
+    repairs = []
+
+    # Keep the data lines, up to any section after ~A and without comments
+    next_section = re.search(r'^[ \t]*~', data_text, re.MULTILINE)
+    if next_section:
+        data_text = data_text[:next_section.start()]
+    if 'DLM' in las.version and str(las.version['DLM'].value).strip().upper() == 'COMMA':
+        data_text = data_text.replace(',', ' ')
+    lines = [line.split() for line in data_text.splitlines() if line.strip() and not line.lstrip().startswith('#')]
+    if not lines:
+        raise FastReadError("No data lines in the ~A section")
+
+    counts = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    most_common_count = int(np.bincount(counts).argmax())
+
+    # Wrapped data spreads each depth step over several lines, so every n_curves values end on a line end
+    declared_wrap = 'WRAP' in las.version and str(las.version['WRAP'].value).strip().upper() == 'YES'
+    line_ends = np.cumsum(counts)
+    step_ends = np.arange(1, line_ends[-1] // n_curves + 1) * n_curves
+    detected_wrap = most_common_count < n_curves and len(step_ends) > 0 and len(lines) > len(step_ends) and np.isin(step_ends, line_ends).all()
+    if declared_wrap or detected_wrap:
+        n_columns = n_curves
+        tokens = [token for line in lines for token in line]
+        n_rows = len(tokens) // n_columns
+        if len(tokens) % n_columns:
+            repairs.append(f"Dropped {len(tokens) % n_columns} trailing values of an incomplete wrapped step")
+            tokens = tokens[:n_rows * n_columns]
+        repairs.append("Unwrapped data section" if declared_wrap else "Unwrapped data section not declared as wrapped")
+        if 'WRAP' in las.version:
+            las.version['WRAP'].value = 'NO'
+    else:
+        n_columns = most_common_count
+        keep = counts == n_columns
+        if not keep.all():
+            repairs.append(f"Dropped {int((~keep).sum())} of {len(lines)} data lines without {n_columns} values")
+        tokens = [token for line, kept in zip(lines, keep) if kept for token in line]
+        n_rows = int(keep.sum())
+
+    if n_rows == 0:
+        raise FastReadError("No complete data lines in the ~A section")
+
+    # Parse all values at once, non-numeric values become NaN
+    values = pd.to_numeric(pd.Series(tokens, dtype=object), errors='coerce').to_numpy(dtype=np.float64, copy=True)
+    n_invalid = int(np.isnan(values).sum() - sum(token.lower() == 'nan' for token in tokens))
+    if n_invalid:
+        repairs.append(f"Replaced {n_invalid} non-numeric values by NaN")
+    data = values.reshape(n_rows, n_columns)
+
+    # Match the curves of the ~C section to the columns found
+    if n_columns < n_curves:
+        dropped = [curve.mnemonic for curve in las.curves[n_columns:]]
+        repairs.append(f"Dropped curves without data ({', '.join(dropped)}), ~C defines {n_curves} curves and ~A holds {n_columns} columns")
+        las.curves = las.curves[:n_columns]
+    elif n_columns > n_curves:
+        repairs.append(f"Dropped {n_columns - n_curves} columns without a curve, ~C defines {n_curves} curves and ~A holds {n_columns} columns")
+        data = data[:, :n_curves]
+
+    replace_null_values(las, data)
+    for i, curve in enumerate(las.curves):
+        curve.data = data[:, i].copy()
+    las.index_initial = las.index.copy()
+
+    # Tag the file with its repair report
+    if repairs:
+        las.well[REPAIR_MNEMONIC] = lasio.HeaderItem(mnemonic=REPAIR_MNEMONIC, value='; '.join(repairs), descr='Salvaged ~A section')
+    return las, repairs
+
+def read_las_text(las_file):
+    """Reads the contents of a LAS file from a path or an open file object.
+
+    Args:
+        las_file (str or file-like): Path of the LAS file or open file object
+
+    Returns:
+        str: Contents of the file, or None if a path is not valid UTF-8
+    """
+    if hasattr(las_file, 'read'):
+        text = las_file.read()
+        if isinstance(text, bytes):
+            text = text.decode('utf-8-sig', errors='replace')
+        return text
+
+    # Other encodings are detected by lasio
+    with open(las_file, 'rb') as f:
+        content = f.read()
+    try:
+        return content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return None
+
+def read_las_header(las_file, **kwargs):
+    """Reads the header sections of a LAS file, stopping at the ~A line without reading the data.
+
+    Args:
+        las_file (str): Path of the LAS file
+        **kwargs: Keyword arguments of lasio.read
+
+    Returns:
+        lasio.LASFile: The LAS file with its ~Version, ~Well, ~Curves, ~Parameter and ~Other
+                       sections and empty curve data
+    """
+    lines = []
+    with open(las_file, 'r', encoding='utf-8-sig', errors='replace') as f:
+        for line in f:
+            lines.append(line)
+            if line.lstrip().startswith('~A'):
+                break
+    return lasio.read(''.join(lines), ignore_data=True, **kwargs)
+
+def read_las(las_file, salvage=False, with_repairs=False, **kwargs):
+    """Reads a LAS file with the fast reader, falling back to lasio for wrapped or malformed files.
+
+    Args:
+        las_file (str or file-like): Path of the LAS file or open file object
+        salvage (bool): Repair wrapped and malformed ~A sections with salvage_las before
+                        falling back to lasio. A repaired file has a REPAIR item in ~Well.
+        with_repairs (bool): Also return the repairs made by salvage_las
+        **kwargs: Keyword arguments of lasio.read
+
+    Returns:
+        lasio.LASFile: The LAS file, or (LAS file, list of repairs) if with_repairs is set
+    """
+    las, repairs = read_las_with_repairs(las_file, salvage, **kwargs)
+    return (las, repairs) if with_repairs else las
+
+def read_las_with_repairs(las_file, salvage, **kwargs):
+    """Reads a LAS file like read_las and returns it with the repairs made by salvage_las."""
+    text = read_las_text(las_file)
+    if text is None:
+        return lasio.read(las_file, **kwargs), []
+    try:
+        return read_las_fast(text, **kwargs), []
+    except FastReadError:
+        pass
+    if salvage:
+        try:
+            return salvage_las(text, **kwargs)
+        except FastReadError:
+            pass
+    return lasio.read(text if hasattr(las_file, 'read') else las_file, **kwargs), []
@@ -0,0 +1,98 @@
+import io
+import numpy as np
+import lasio
+
+# Number of data rows formatted per vectorized chunk
+WRITE_CHUNK_ROWS = 50000
+
+class _HeaderComplete(Exception):
+    """Raised by _HeaderCapture once lasio has written the ~A line."""
+
+class _HeaderCapture(io.StringIO):
+    """Collects what lasio writes and stops it as soon as the ~A line is written.
+
+    lasio writes the header sections in one call and the ~A line in the next one, so
+    stopping there keeps the header byte-identical while skipping its row-by-row data loop.
+    """
+    def write(self, text):
+        super().write(text)
+        if text.startswith('~A'):
+            raise _HeaderComplete()
+        return len(text)
+
+def get_len_numeric_field(fmt):
+    """Width of each data column, computed the way lasio does when len_numeric_field is None."""
+    len_numeric_field = 10
+    while len(fmt % np.pi) > (len_numeric_field - 1):
+        len_numeric_field += 1
+    return len_numeric_field
+
+def format_data_rows(data, null_value, fmt, column_fmt, len_numeric_field, lhs_spacer=" ", spacer=" "):
+    """Formats a block of the data array into LAS lines with NumPy string operations.
+
+    Each value is formatted with its column format, NaNs are replaced by the NULL value
+    as written by lasio, values are right-justified to len_numeric_field and joined with
+    the spacers.
+
+    Args:
+        data (np.ndarray): 2D float array, rows are depth steps
+        null_value: Value of the NULL header item
+        fmt (str): Default format of the numeric values
+        column_fmt (dict): Format per column index, overriding fmt
+        len_numeric_field (int): Width of each numeric field
+
+    Returns:
+        str: The formatted lines, each terminated by a newline
+    """
+    null_text = str(null_value)
+    lines = None
+    for j in range(data.shape[1]):
+        column = data[:, j]
+        values = np.char.mod(column_fmt.get(j, fmt), column)
+        values = np.where(np.isnan(column), null_text, values)
+        values = np.char.add(lhs_spacer if j == 0 else spacer, np.char.rjust(values, len_numeric_field))
+        lines = values if lines is None else np.char.add(lines, values)
+    return '\n'.join(lines.tolist()) + '\n'
+
+def write_las_file(las, output_path, fmt='%.5f', column_fmt=None, mnemonics_header=False, **kwargs):
+    """Writes a LAS file like lasio.LASFile.write, formatting the ~A section in vectorized chunks.
+
+    The header sections and the ~A line are produced by lasio itself, so the output is
+    byte-identical to las.write(output_path, fmt=fmt, column_fmt=column_fmt,
+    mnemonics_header=mnemonics_header). Wrapped files and non-numeric data fall back to
+    lasio's own writer.
+
+    Args:
+        las (lasio.LASFile): The LAS file to write
+        output_path (str): Path of the file to write
+        fmt (str): Format of the numeric values
+        column_fmt (dict): Format per column index, overriding fmt
+        mnemonics_header (bool): Include the curve mnemonics in the ~A line
+        **kwargs: Other keyword arguments of lasio.writer.write
+    """
+    column_fmt = column_fmt or {}
+    data = las.data
+
+    # Cases this writer does not reproduce are left to lasio
+    wrap = kwargs.get('wrap')
+    if wrap is None:
+        wrap = las.version['WRAP'].value == 'YES' if 'WRAP' in las.version else False
+    unsupported_kwargs = set(kwargs) - {'version', 'wrap', 'STRT', 'STOP', 'STEP'}
+    if wrap or unsupported_kwargs or data.ndim != 2 or data.shape[0] == 0 or not np.issubdtype(data.dtype, np.floating):
+        las.write(output_path, fmt=fmt, column_fmt=column_fmt, mnemonics_header=mnemonics_header, **kwargs)
+        return
+
+    # Let lasio write (and update) the header sections up to the ~A line
+    header = _HeaderCapture()
+    try:
+        lasio.writer.write(las, header, fmt=fmt, column_fmt=column_fmt, mnemonics_header=mnemonics_header, **kwargs)
+    except _HeaderComplete:
+        pass
+
+    len_numeric_field = get_len_numeric_field(fmt)
+    null_value = las.well['NULL'].value
+
+    with open(output_path, 'w') as f:
+        f.write(header.getvalue())
+        for start in range(0, data.shape[0], WRITE_CHUNK_ROWS):
+            f.write(format_data_rows(data[start:start + WRITE_CHUNK_ROWS], null_value, fmt, column_fmt, len_numeric_field))
@@ -1,16 +1,31 @@
+import hashlib
+import io
 import os
 import re
 import zipfile
 import lasio
 import tempfile
 import json
-import multiprocessing
 import contextlib
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 import sys
 from pathlib import Path
+from utils.las_writer import write_las_file
+from utils.las_reader import read_las, REPAIR_MNEMONIC
+from utils.las_inventory import scan_las_inventory
+
+# Name of the per-field manifest mapping each processed input to its output LAS file
+PROCESSING_MANIFEST_FILENAME = 'processing_manifest.json'
+
+# Grouped error report, and the folder of per-process JSONL journals it is compacted from
+ERROR_REPORT_PATH = os.path.join('../reports', '02_LAS_update_error_report.json')
+ERROR_JOURNAL_FOLDER = os.path.join('../reports', '02_LAS_update_error_journal')
+
+# Journal of the current process and the errors it already wrote. Keyed by pid so a
+# forked worker never writes through the handle it inherited from the parent.
+_error_journal = {'pid': None, 'file': None, 'logged': set()}
 
 def print_progress_bar(iteration, total, field_name, max_field_length, length=50):
     """Prints a progress bar showing the progress of iterating through a total number of items.
@@ -44,54 +59,121 @@ def print_progress_bar(iteration, total, field_name, max_field_length, length=50
     if iteration == total:
         print()
 
+# Per-process state of the LAS workers, set once by init_las_worker
+_worker_processor = None
+_worker_field_tables = {}
+
+def init_las_worker(processor, field_tables):
+    """Pool initializer: receives the processor and the metadata tables of every field once per worker.
+
+    Args:
+      processor: The LASFileProcessor running the job
+      field_tables: Dict of field name -> {'destination_folder', 'field_index'}
+    """
+    global _worker_processor, _worker_field_tables
+    _worker_processor = processor
+    _worker_field_tables = field_tables
+
+def clean_and_save_las_task(las_file, field_name, kid, output_file_name):
+    """Worker entry point: cleans one LAS file using the tables broadcast by init_las_worker.
+
+    Only the file reference, field name, KID and output name travel with each task.
+    """
+    tables = _worker_field_tables[field_name]
+    return _worker_processor.clean_and_save_las_file(las_file, tables['destination_folder'], tables['field_index'], kid, field_name, output_file_name)
+
 class LASFileProcessor:
-    def __init__(self, source_folder, destination_folder, csv_folder):
+    def __init__(self, source_folder, destination_folder, csv_folder, stream_from_zip=True, salvage=True, merge_runs=False, build_catalog=True):
+        """
+        Options: stream_from_zip reads LAS members out of their zips, salvage repairs broken ~A
+        sections, merge_runs writes one file per well, build_catalog refreshes the header catalog.
+        """
         self.source_folder = source_folder
         self.destination_folder = destination_folder
         self.csv_folder = csv_folder
-        self.lock = multiprocessing.Manager().Lock() 
+        self.stream_from_zip = stream_from_zip
+        self.salvage = salvage
+        self.merge_runs = merge_runs
+        self.build_catalog = build_catalog
 
     def process_las_files(self):
+        """
+        Cleans the LAS files of every field with a single worker pool, largest files first.
+        """
         field_folders = sorted([d for d in os.listdir(self.source_folder) if os.path.isdir(os.path.join(self.source_folder, d))])
 
         if not field_folders:
             print("No field folders found in the source directory.")
             return
 
-        max_field_length = max(len(field_folder_name) for field_folder_name in field_folders)
-        
-        for i, field_folder_name in enumerate(field_folders):
-            field_source_folder = os.path.join(self.source_folder, field_folder_name)
-            final_destination_folder = os.path.join(self.destination_folder, field_folder_name)
+        # 'Total' labels the overall progress bar
+        max_field_length = max(len(field_folder_name) for field_folder_name in field_folders + ['Total'])
+
+        fields = {}
+        tasks = []
+        with contextlib.ExitStack() as temp_dirs:
+            for field_folder_name in field_folders:
+                field = self.plan_field(field_folder_name)
+                if field is None:
+                    continue
+
+                # Nothing changed in this field
+                if not field['tasks']:
+                    self.finalize_field(field)
+                    print_progress_bar(1, 1, field_folder_name, max_field_length)
+                    continue
+
+                # Only the members of pending tasks are extracted, the folder goes with the field's last task
+                if not self.stream_from_zip:
+                    self.extract_task_inputs(field, temp_dirs)
+
+                fields[field_folder_name] = field
+                for key, las_file, content_hash, output_file_name, size in field['tasks']:
+                    tasks.append((field_folder_name, key, las_file, content_hash, output_file_name, size))
+
+            # Largest files first so a big file never runs alone at the tail of the run
+            tasks.sort(key=lambda task: task[-1], reverse=True)
+
+            if tasks:
+                # Ship the metadata tables to each worker once instead of pickling them with every task
+                field_tables = {field_name: self.get_field_tables(field) for field_name, field in fields.items()}
+
+                with ProcessPoolExecutor(initializer=init_las_worker, initargs=(self, field_tables)) as executor:
+                    futures = {}
+                    for field_name, key, las_file, content_hash, output_file_name, _ in tasks:
+                        kid = fields[field_name]['las_to_kid_map'].get(self.get_task_inputs(las_file)[0])
+                        future = executor.submit(clean_and_save_las_task, self.get_extracted_inputs(fields[field_name], las_file), field_name, kid, output_file_name)
+                        futures[future] = (field_name, key, las_file, content_hash)
 
-            os.makedirs(final_destination_folder, exist_ok=True)
+                    for j, future in enumerate(as_completed(futures)):
+                        field_name, key, las_file, content_hash = futures[future]
+                        field = fields[field_name]
+                        try:
+                            output_file_name = future.result()
+                        except Exception as e:
+                            self.log_error(field_name, self.get_las_file_name(las_file), str(e), "Error processing LAS file.")
+                            output_file_name = None
 
-            wells_df, logs_df, las_df, tops_df = self.load_csv_files(field_folder_name)
-            if wells_df.empty or logs_df.empty or las_df.empty or tops_df.empty:
-                error_message = f"Missing CSV files for field {field_folder_name}"
-                #print(error_message)
-                self.log_error(field_folder_name, field_folder_name, error_message, "Missing CSV files.")
-                continue
+                        # Record the inputs only once their output is written
+                        if output_file_name:
+                            keys, content_hashes = (key, content_hash) if isinstance(key, tuple) else ((key,), (content_hash,))
+                            for input_key, input_hash in zip(keys, content_hashes):
+                                field['manifest'][input_key] = {'hash': input_hash, 'csv_hash': field['csv_hash'], 'output': output_file_name}
 
-            zip_files = [f for f in os.listdir(field_source_folder) if f.lower().endswith('.zip')]
+                        # Close the field as soon as its last file is done
+                        field['pending'] -= 1
+                        if field['pending'] == 0:
+                            self.finalize_field(field)
+                            print_progress_bar(1, 1, field_name, max_field_length)
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                for zip_file in zip_files:
-                    zip_file_path = os.path.join(field_source_folder, zip_file)
-                    self.unzip_files(zip_file_path, temp_dir)
+                        print_progress_bar(j + 1, len(tasks), 'Total', max_field_length)
 
-                las_files = [os.path.join(temp_dir, f) for f in os.listdir(temp_dir) if f.lower().endswith('.las')]
-                las_to_kid_map = self.map_las_files_to_kids(las_files, las_df, field_folder_name)
+        # Merge the error journals of all processes into the grouped report
+        self.compact_error_journal()
 
-                with ProcessPoolExecutor() as executor:
-                    futures = {executor.submit(self.clean_and_save_las_file, las_file, final_destination_folder, wells_df, logs_df, tops_df, las_to_kid_map.get(las_file), field_folder_name): las_file for las_file in las_files}
-                    for j, future in enumerate(as_completed(futures)):
-                        las_file = futures[future]
-                        try:
-                            future.result()
-                        except Exception as e:
-                            self.log_error(field_folder_name, las_file, str(e), "Error processing LAS file.")
-                        print_progress_bar(j + 1, len(las_files), field_folder_name, max_field_length)
+        # Catalog the headers of the new and changed output files
+        if self.build_catalog:
+            scan_las_inventory(self.destination_folder)
 
         # Print the completion message after all fields are processed
         blue = '\033[94m'
@@ -99,24 +181,487 @@ class LASFileProcessor:
         error_report_file = Path('../reports/02_LAS_update_error_report.json')
         print(f"LAS file processing completed. Please check '{blue}{error_report_file}{reset}' for details.")
 
-    def clean_and_save_las_file(self, las_file_path, destination_folder, wells_df, logs_df, tops_df, kid, field_name):
-        las_file_name = os.path.basename(las_file_path)
+    def plan_field(self, field_folder_name):
+        """
+        Loads the metadata of a field and works out which of its inputs must be processed.
+        """
+        field_source_folder = os.path.join(self.source_folder, field_folder_name)
+        final_destination_folder = os.path.join(self.destination_folder, field_folder_name)
+
+        os.makedirs(final_destination_folder, exist_ok=True)
+
+        wells_df, logs_df, las_df, tops_df = self.load_csv_files(field_folder_name)
+        if wells_df.empty or logs_df.empty or las_df.empty or tops_df.empty:
+            error_message = f"Missing CSV files for field {field_folder_name}"
+            self.log_error(field_folder_name, field_folder_name, error_message, "Missing CSV files.")
+            return None
+
+        zip_files = [os.path.join(field_source_folder, f) for f in os.listdir(field_source_folder) if f.lower().endswith('.zip')]
+
+        # Plan on the (zip, member) pairs, so unchanged fields are never extracted
+        las_files = self.list_las_members(zip_files, field_folder_name)
+
+        # Index the metadata by KID once, every per-file lookup is then a dict access
+        field_index = self.build_field_index(field_folder_name, wells_df, logs_df, las_df, tops_df)
+        if field_index is None:
+            return None
+
+        las_to_kid_map = self.map_las_files_to_kids(las_files, field_index, field_folder_name)
+
+        # Only inputs that are new or changed since the last run need to be processed
+        csv_hash = self.hash_csv_files(field_folder_name)
+        first_run = not os.path.exists(os.path.join(final_destination_folder, PROCESSING_MANIFEST_FILENAME))
+        previous_manifest = self.load_processing_manifest(final_destination_folder)
+        if self.merge_runs:
+            manifest, tasks = self.plan_merged_tasks(final_destination_folder, previous_manifest, csv_hash, las_to_kid_map, field_index)
+        else:
+            manifest, tasks = self.plan_incremental_tasks(las_files, final_destination_folder, previous_manifest, csv_hash, las_to_kid_map, field_index)
+
+        return {
+            'name': field_folder_name,
+            'destination_folder': final_destination_folder,
+            'field_index': field_index,
+            'las_to_kid_map': las_to_kid_map,
+            'csv_hash': csv_hash,
+            'first_run': first_run,
+            'previous_manifest': previous_manifest,
+            'manifest': manifest,
+            'tasks': tasks,
+            'pending': len(tasks),
+            'temp_dir': None,
+            'extracted': {},
+        }
+
+    def extract_task_inputs(self, field, temp_dirs):
+        """
+        Extracts the LAS members of the pending tasks of a field to a temporary folder owned by temp_dirs.
+        """
+        temp_dir = tempfile.TemporaryDirectory()
+        temp_dirs.callback(temp_dir.cleanup)
+        field['temp_dir'] = temp_dir
+
+        members_by_zip = {}
+        for _, las_file, _, _, _ in field['tasks']:
+            for zip_file_path, member_name in self.get_task_inputs(las_file):
+                members_by_zip.setdefault(zip_file_path, []).append(member_name)
 
-        with contextlib.redirect_stderr(open(os.devnull, 'w')):
+        # One subfolder per zip, members of different zips may share a name
+        for i, (zip_file_path, member_names) in enumerate(members_by_zip.items()):
             try:
-                las = lasio.read(las_file_path, engine='normal')
-            except ValueError as e:
-                self.log_error(field_name, las_file_path, str(e), "Error reading LAS file.")
-                return
+                with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+                    for member_name in member_names:
+                        field['extracted'][(zip_file_path, member_name)] = zip_ref.extract(member_name, os.path.join(temp_dir.name, str(i)))
+            except zipfile.BadZipFile as e:
+                self.log_error(field['name'], zip_file_path, str(e), "Bad ZIP file.")
+            except Exception as e:
+                self.log_error(field['name'], zip_file_path, str(e), "General error during unzipping.")
+
+    def get_extracted_inputs(self, field, las_file):
+        """
+        Returns the extracted path of each input of a task, the input itself if it was not extracted.
+        """
+        if isinstance(las_file, list):
+            return [field['extracted'].get(run, run) for run in las_file]
+        return field['extracted'].get(las_file, las_file)
+
+    def get_field_tables(self, field):
+        """
+        Returns the metadata lookups the workers need for a field, reduced to the KIDs of
+        its pending tasks so the tables broadcast to the workers stay small.
+        """
+        kids = {field['las_to_kid_map'].get(las_file) for _, task_inputs, _, _, _ in field['tasks'] for las_file in self.get_task_inputs(task_inputs)}
+        kids.discard(None)
+        field_index = field['field_index']
+        return {
+            'destination_folder': field['destination_folder'],
+            'field_index': {
+                'wells': {kid: row for kid, row in field_index['wells'].items() if kid in kids},
+                'logs': {kid: row for kid, row in field_index['logs'].items() if kid in kids},
+                'well_names': {kid: name for kid, name in field_index['well_names'].items() if kid in kids},
+                'formations': {kid: block for kid, block in field_index['formations'].items() if kid in kids},
+                'las_kids': {},
+            },
+        }
+
+    def build_field_index(self, field_name, wells_df, logs_df, las_df, tops_df):
+        """
+        Builds the KID-keyed lookups of a field from its metadata CSVs, None if a column is missing.
+        """
+        try:
+            # First row of each KID, as the former iloc[0] lookups
+            wells = {row['KID']: row for row in wells_df.drop_duplicates('KID').to_dict('records')}
+            logs = {row['KID']: row for row in logs_df.drop_duplicates('KID').to_dict('records')}
+            las_kids = dict(zip(las_df.drop_duplicates('LASFILE')['LASFILE'], las_df.drop_duplicates('LASFILE')['KID']))
+
+            # Wells without a lease or well name get no entry and are reported by the worker
+            well_names = {}
+            for kid, row in wells.items():
+                if isinstance(row['LEASE_NAME'], str) and isinstance(row['WELL_NAME'], str):
+                    lease_name = row['LEASE_NAME'].replace(" ", "_").replace("/", "-").title()
+                    well_name = row['WELL_NAME'].replace(" ", "_").replace("/", "-").title()
+                    well_names[kid] = f"{lease_name}_{well_name}"
+
+            # Render every formation line at once, then join them per KID
+            formation_lines = tops_df['BASE'].map(str) + ',' + tops_df['TOP'].map(str) + ',' + tops_df['FORMATION'].map(str) + '\n'
+            formations = {kid: "BASE,TOP,FORMATION\n" + lines for kid, lines in formation_lines.groupby(tops_df['KID'], sort=False).agg(''.join).items()}
+        except KeyError as e:
+            self.log_error(field_name, field_name, str(e), "Key error when retrieving well or log information.")
+            return None
+
+        return {'wells': wells, 'logs': logs, 'well_names': well_names, 'formations': formations, 'las_kids': las_kids}
+
+    def finalize_field(self, field):
+        """
+        Removes the stale outputs of a finished field, saves its manifest and deletes its
+        temporary extraction folder.
+        """
+        self.remove_stale_outputs(field['destination_folder'], field['previous_manifest'], field['manifest'], field['first_run'])
+        self.save_processing_manifest(field['destination_folder'], field['manifest'])
+        if field['temp_dir'] is not None:
+            field['temp_dir'].cleanup()
+
+    def get_las_input_key(self, las_file):
+        """
+        Returns the manifest key of an input: 'zip name/member name' for zip members, the file name otherwise.
+        """
+        if isinstance(las_file, tuple):
+            return f"{os.path.basename(las_file[0])}/{las_file[1]}"
+        return os.path.basename(las_file)
+
+    def get_las_file_info(self, las_file):
+        """
+        Returns the content hash and uncompressed size of an input, from the zip directory for members.
+        """
+        if isinstance(las_file, tuple):
+            zip_file_path, member_name = las_file
+            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+                info = zip_ref.getinfo(member_name)
+            return f"crc32:{info.CRC:08x}:{info.file_size}", info.file_size
+
+        sha256 = hashlib.sha256()
+        with open(las_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return f"sha256:{sha256.hexdigest()}", os.path.getsize(las_file)
+
+    def hash_csv_files(self, field_folder_name):
+        """
+        Returns a SHA-256 over the metadata CSVs (Wells, Logs, LAS, Tops) of a field.
+        A change in any of them invalidates every output of the field.
+        """
+        field_folder_path = os.path.join(self.csv_folder, field_folder_name)
+        sha256 = hashlib.sha256()
+        for file_name in sorted(os.listdir(field_folder_path)):
+            if any(prefix in file_name for prefix in ('Wells_', 'Logs_', 'LAS_', 'Tops_')):
+                sha256.update(file_name.encode())
+                with open(os.path.join(field_folder_path, file_name), 'rb') as f:
+                    sha256.update(f.read())
+        return sha256.hexdigest()
+
+    def load_processing_manifest(self, destination_folder):
+        """
+        Loads the processing manifest of a field, or an empty one if missing or unreadable.
+        """
+        manifest_path = os.path.join(destination_folder, PROCESSING_MANIFEST_FILENAME)
+        if not os.path.exists(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def save_processing_manifest(self, destination_folder, manifest):
+        """
+        Writes the processing manifest of a field atomically.
+        """
+        manifest_path = os.path.join(destination_folder, PROCESSING_MANIFEST_FILENAME)
+        temp_path = manifest_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+        os.replace(temp_path, manifest_path)
+
+    def plan_incremental_tasks(self, las_files, destination_folder, previous_manifest, csv_hash, las_to_kid_map, field_index):
+        """
+        Splits the inputs of a field into unchanged ones (kept in the manifest) and tasks to process.
+        """
+        previous_outputs = {}
+        manifest = {}
+        pending = []
+
+        for las_file in las_files:
+            key = self.get_las_input_key(las_file)
+            content_hash, size = self.get_las_file_info(las_file)
+            record = previous_manifest.get(key)
+            previous_outputs[key] = record['output'] if record else None
+
+            if record and record['hash'] == content_hash and record['csv_hash'] == csv_hash and os.path.exists(os.path.join(destination_folder, record['output'])):
+                manifest[key] = record
+            else:
+                pending.append((key, las_file, content_hash, size))
+
+        # Names already taken by unchanged outputs
+        used_names = {record['output'] for record in manifest.values()}
 
-        well_info, log_info = self.get_well_information(field_name, kid, wells_df, logs_df)
+        tasks = []
+        for key, las_file, content_hash, size in sorted(pending, key=lambda task: task[0]):
+            kid = las_to_kid_map.get(las_file)
+            well_name = self.get_well_name(kid, field_index) if kid is not None else None
+
+            # Let the worker report the missing well name
+            if well_name is None:
+                tasks.append((key, las_file, content_hash, None, size))
+                continue
+
+            output_file_name = self.assign_output_file_name(well_name, used_names, previous_outputs[key])
+            used_names.add(output_file_name)
+            tasks.append((key, las_file, content_hash, output_file_name, size))
+
+        return manifest, tasks
+
+    def plan_merged_tasks(self, destination_folder, previous_manifest, csv_hash, las_to_kid_map, field_index):
+        """
+        Groups the inputs of a field by KID, a group is merged again if any of its runs changed.
+        """
+        kid_to_las_files_map = self.map_kids_to_las_files(las_to_kid_map)
+
+        # Inputs that produced each previous output
+        previous_inputs = {}
+        for key, record in previous_manifest.items():
+            previous_inputs.setdefault(record['output'], set()).add(key)
+
+        manifest = {}
+        pending = []
+        for kid, kid_las_files in kid_to_las_files_map.items():
+            runs = sorted((self.get_las_input_key(las_file), las_file) for las_file in kid_las_files)
+            keys = tuple(key for key, _ in runs)
+            infos = [self.get_las_file_info(las_file) for _, las_file in runs]
+            records = [previous_manifest.get(key) for key in keys]
+            outputs = {record['output'] for record in records if record}
+
+            unchanged = (
+                all(record and record['hash'] == content_hash and record['csv_hash'] == csv_hash for record, (content_hash, _) in zip(records, infos))
+                and len(outputs) == 1
+                and previous_inputs.get(next(iter(outputs))) == set(keys)
+                and os.path.exists(os.path.join(destination_folder, next(iter(outputs))))
+            )
+            if unchanged:
+                manifest.update(zip(keys, records))
+            else:
+                preferred = next(iter(outputs)) if len(outputs) == 1 else None
+                pending.append((kid, keys, [las_file for _, las_file in runs], tuple(content_hash for content_hash, _ in infos), sum(size for _, size in infos), preferred))
+
+        # Names already taken by unchanged outputs
+        used_names = {record['output'] for record in manifest.values()}
+
+        tasks = []
+        for kid, keys, kid_las_files, content_hashes, size, preferred in sorted(pending, key=lambda task: task[1]):
+            well_name = self.get_well_name(kid, field_index)
+
+            # Let the worker report the missing well name
+            if well_name is None:
+                tasks.append((keys, kid_las_files, content_hashes, None, size))
+                continue
+
+            output_file_name = self.assign_output_file_name(well_name, used_names, preferred)
+            used_names.add(output_file_name)
+            tasks.append((keys, kid_las_files, content_hashes, output_file_name, size))
+
+        return manifest, tasks
+
+    def merge_las_runs(self, runs, field_name):
+        """
+        Merges the runs of one well on the union of their depths, the first run with a value keeps it.
+        """
+        base_name, base = runs[0]
+        base_unit = base.index_unit
+
+        # Depths and curves of each run, sorted by depth
+        run_data = []
+        for run_name, las in runs:
+            las = self.standardize_curve_information(las)
+            depth = np.asarray(las.index, dtype=float)
+            if base_unit in ('m', 'ft') and las.index_unit in ('m', 'ft') and las.index_unit != base_unit:
+                depth = np.asarray(las.depth_m if base_unit == 'm' else las.depth_ft, dtype=float)
+            depth = np.round(depth, 4)
+            valid = ~np.isnan(depth)
+            order = np.argsort(depth[valid], kind='stable')
+            run_data.append((run_name, depth[valid][order], las.curves[1:], valid, order))
+
+        depth_index = np.unique(np.concatenate([depth for _, depth, _, _, _ in run_data]))
+
+        # Fill each curve run by run, the first value at a depth wins
+        merged_curves = {}
+        conflicts = {}
+        for run_name, depth, curves, valid, order in run_data:
+            # Repeated depths of a run follow the same rule, the first row with a value keeps it
+            starts = np.flatnonzero(np.r_[True, depth[1:] != depth[:-1]]) if depth.size else np.empty(0, dtype=int)
+            rows = np.searchsorted(depth_index, depth[starts])
+            duplicates = {}
+            for curve in curves:
+                values = np.asarray(curve.data, dtype=float)[valid][order]
+                if starts.size < depth.size:
+                    values, differing = self.first_value_per_depth(values, starts)
+                    if differing:
+                        duplicates[curve.mnemonic] = differing
+                if curve.mnemonic not in merged_curves:
+                    merged_curves[curve.mnemonic] = (curve, np.full(depth_index.size, np.nan))
+                merged = merged_curves[curve.mnemonic][1]
+                current = merged[rows]
+                overlap = ~np.isnan(current) & ~np.isnan(values)
+                differing = int(np.count_nonzero(overlap & ~np.isclose(current, values)))
+                if differing:
+                    conflicts[curve.mnemonic] = conflicts.get(curve.mnemonic, 0) + differing
+                merged[rows] = np.where(np.isnan(current), values, current)
+
+            if duplicates:
+                details = ', '.join(f"{mnemonic} ({count})" for mnemonic, count in duplicates.items())
+                self.log_error(field_name, self.get_las_file_name(run_name), f"Values at repeated depths differ: {details}", "LAS run has repeated depths, first value kept.")
+
+        if conflicts:
+            details = ', '.join(f"{mnemonic} ({count})" for mnemonic, count in conflicts.items())
+            self.log_error(field_name, self.get_las_file_name(base_name), f"Overlapping values differ between runs: {details}", "LAS runs merged, first run kept.")
+
+        # Rebuild the curves of the first run on the merged index
+        index_curve = base.curves[0]
+        base.curves = lasio.SectionItems()
+        base.append_curve(index_curve.mnemonic, depth_index, unit=index_curve.unit, descr=index_curve.descr)
+        for mnemonic, (curve, data) in merged_curves.items():
+            base.append_curve(mnemonic, data, unit=curve.unit, descr=curve.descr)
+        return base
+
+    @staticmethod
+    def first_value_per_depth(values, starts):
+        """
+        Keeps the first non-NaN value of each repeated depth, returns it and the number of differing values.
+        """
+        # Position of the first non-NaN row of each depth, len(values) if there is none
+        positions = np.where(np.isnan(values), values.size, np.arange(values.size))
+        first = np.minimum.reduceat(positions, starts)
+        kept = np.where(first < values.size, values[np.minimum(first, values.size - 1)], np.nan)
+
+        # Compare every row with the value kept at its depth
+        depth_of_row = np.repeat(np.arange(starts.size), np.diff(np.r_[starts, values.size]))
+        reference = kept[depth_of_row]
+        differing = int(np.count_nonzero(~np.isnan(values) & ~np.isclose(values, reference)))
+        return kept, differing
+
+    def assign_output_file_name(self, well_name, used_names, preferred=None):
+        """
+        Returns the output file name of a well: the preferred name if it is still free and
+        belongs to the well, else the first free of <well>.las, <well>_part1.las, ...
+        """
+        pattern = re.compile(re.escape(well_name) + r'(_part\d+)?\.las')
+        if preferred and preferred not in used_names and pattern.fullmatch(preferred):
+            return preferred
+
+        output_file_name = f"{well_name}.las"
+        counter = 1
+        while output_file_name in used_names:
+            output_file_name = f"{well_name}_part{counter}.las"
+            counter += 1
+        return output_file_name
+
+    def remove_stale_outputs(self, destination_folder, previous_manifest, manifest, first_run):
+        """
+        Deletes outputs that no current input produces anymore.
+        """
+        current_outputs = {record['output'] for record in manifest.values()}
+        if first_run:
+            previous_outputs = {f for f in os.listdir(destination_folder) if f.lower().endswith('.las')}
+        else:
+            previous_outputs = {record['output'] for record in previous_manifest.values()}
+
+        for output_file_name in previous_outputs - current_outputs:
+            output_path = os.path.join(destination_folder, output_file_name)
+            if os.path.exists(output_path):
+                os.remove(output_path)
+
+    def list_las_members(self, zip_files, field_name):
+        """
+        Lists the LAS members of the zips of a field as (zip path, member name) pairs.
+        """
+        las_members = []
+        for zip_file_path in zip_files:
+            try:
+                with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+                    for member in zip_ref.infolist():
+                        if not member.is_dir() and member.filename.lower().endswith('.las'):
+                            las_members.append((zip_file_path, member.filename))
+            except zipfile.BadZipFile as e:
+                self.log_error(field_name, zip_file_path, str(e), "Bad ZIP file.")
+            except Exception as e:
+                self.log_error(field_name, zip_file_path, str(e), "General error during unzipping.")
+        return las_members
+
+    def get_las_file_name(self, las_file):
+        """
+        Returns the file name of a LAS path or of a (zip path, member name) pair.
+        The runs of a merged task are joined with ' + '.
+        """
+        if isinstance(las_file, list):
+            return ' + '.join(self.get_las_file_name(run) for run in las_file)
+        if isinstance(las_file, tuple):
+            return os.path.basename(las_file[1])
+        return os.path.basename(las_file)
+
+    def get_task_inputs(self, las_file):
+        """
+        Returns the inputs of a task as a list: the runs of a merged task, or the single input.
+        """
+        return las_file if isinstance(las_file, list) else [las_file]
+
+    def read_las_file(self, las_file):
+        """
+        Reads a LAS file from disk or out of its zip, returns it with the repairs made by salvage.
+        """
+        if isinstance(las_file, tuple):
+            zip_file_path, member_name = las_file
+            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+                with zip_ref.open(member_name) as member:
+                    # Decode like lasio does for files on disk, replacing undecodable bytes
+                    return read_las(io.TextIOWrapper(member, encoding='utf-8-sig', errors='replace'), salvage=self.salvage, with_repairs=True, engine='normal')
+        return read_las(las_file, salvage=self.salvage, with_repairs=True, engine='normal')
+
+    def clean_and_save_las_file(self, las_file_path, destination_folder, field_index, kid, field_name, output_file_name=None):
+        """
+        Cleans one LAS file (or the runs of a merged task) and returns the name of the written file.
+        """
+        las_file_name = self.get_las_file_name(las_file_path)
+
+        # Read every run of a merged task, skipping the runs that cannot be read
+        runs = []
+        repairs = []
+        for run_file in self.get_task_inputs(las_file_path):
+            run_file_name = self.get_las_file_name(run_file)
+            with contextlib.redirect_stderr(open(os.devnull, 'w')):
+                try:
+                    run, run_repairs = self.read_las_file(run_file)
+                except ValueError as e:
+                    self.log_error(field_name, run_file_name, str(e), "Error reading LAS file.")
+                    continue
+
+            # Record the repairs of a salvaged ~A section in the report
+            if run_repairs:
+                self.log_error(field_name, run_file_name, '; '.join(run_repairs), "LAS file salvaged.")
+                repairs.extend(run_repairs)
+            runs.append((run_file_name, run))
+
+        if not runs:
+            return
+        if len(runs) == 1:
+            las = runs[0][1]
+        else:
+            las = self.merge_las_runs(runs, field_name)
+
+        well_info, log_info = self.get_well_information(field_name, kid, field_index)
 
         if well_info is None or log_info is None:
             return
 
-        well_name = self.get_well_name(kid, wells_df)
+        well_name = self.get_well_name(kid, field_index)
         if well_name is None:
-            self.log_error(field_name, las_file_path, f"No well name found for KID {kid}", "Error during the processing of the LAS file.")
+            self.log_error(field_name, las_file_name, f"No well name found for KID {kid}", "Error during the processing of the LAS file.")
             return
 
         # Standardize curve information
@@ -125,8 +670,12 @@ class LASFileProcessor:
         # Update the well section
         las = self.update_well_information(las, well_info, log_info)
 
+        # Tag the file with the repairs of its runs, update_well_information drops unknown items
+        if repairs:
+            las.well[REPAIR_MNEMONIC] = lasio.HeaderItem(mnemonic=REPAIR_MNEMONIC, value='; '.join(repairs), descr='Salvaged ~A section')
+
         # Retrieve formation information and add to the "Other" section
-        formation_info = self.get_formation_information(kid, tops_df)
+        formation_info = self.get_formation_information(kid, field_index)
         if formation_info:
             las.sections['Other'] = formation_info
 
@@ -145,46 +694,29 @@ class LASFileProcessor:
 
         # Check if the data array is not empty before writing the LAS file
         if las.data.size == 0:
-            self.log_error(field_name, las_file_path, "ASCII data section is empty", "Error during the processing of the LAS file.")
+            self.log_error(field_name, las_file_name, "ASCII data section is empty", "Error during the processing of the LAS file.")
             return
 
         # Create output path and write the cleaned LAS file
-        output_file_name = f"{well_name}.las"
-        output_path = os.path.join(destination_folder, output_file_name)
-
-        # Check if the file already exists and modify the name if necessary
-        counter = 1
-        while os.path.exists(output_path):
-            output_file_name = f"{well_name}_part{counter}.las"
+        if output_file_name is None:
+            output_file_name = f"{well_name}.las"
             output_path = os.path.join(destination_folder, output_file_name)
-            counter += 1
 
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        las.write(output_path, fmt='%.4f', column_fmt={0: '%.2f'}, mnemonics_header=True)
+            # Check if the file already exists and modify the name if necessary
+            counter = 1
+            while os.path.exists(output_path):
+                output_file_name = f"{well_name}_part{counter}.las"
+                output_path = os.path.join(destination_folder, output_file_name)
+                counter += 1
 
-    def unzip_files(self, zip_file_path, destination_folder):
-        try:
-            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                zip_ref.extractall(destination_folder)
-        except FileNotFoundError as e:
-            self.log_error(os.path.basename(zip_file_path), zip_file_path, str(e), "ZIP file not found.")
-        except zipfile.BadZipFile as e:
-            self.log_error(os.path.basename(zip_file_path), zip_file_path, str(e), "Bad ZIP file.")
-        except PermissionError as e:
-            self.log_error(os.path.basename(zip_file_path), zip_file_path, str(e), "Permission error.")
-        except Exception as e:
-            self.log_error(os.path.basename(zip_file_path), zip_file_path, str(e), "General error during unzipping.")
+        output_path = os.path.join(destination_folder, output_file_name)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        write_las_file(las, output_path, fmt='%.4f', column_fmt={0: '%.2f'}, mnemonics_header=True)
+        return output_file_name
 
-    def get_formation_information(self, kid, tops_df):
-        formations = tops_df[tops_df['KID'] == kid]
-        if formations.empty:
-            return None
-        
-        formation_info = "BASE,TOP,FORMATION\n"
-        for _, row in formations.iterrows():
-            formation_info += f"{row['BASE']},{row['TOP']},{row['FORMATION']}\n"
-        
-        return formation_info
+    def get_formation_information(self, kid, field_index):
+        # Blocks are pre-rendered by build_field_index
+        return field_index['formations'].get(kid)
 
     def standardize_curve_information(self, las):
         standardized_curves = []
@@ -272,16 +804,15 @@ class LASFileProcessor:
             self.log_error(field_folder_name, field_folder_path, str(e), "General error loading CSV files.")
             return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    def map_las_files_to_kids(self, las_files, las_df, field_folder_name):
+    def map_las_files_to_kids(self, las_files, field_index, field_folder_name):
         las_to_kid_map = {}
         for las_file in las_files:
-            las_file_name = os.path.basename(las_file)
+            las_file_name = self.get_las_file_name(las_file)
             try:
-                las_entry = las_df[las_df['LASFILE'] == las_file_name]
-                if las_entry.empty:
+                if las_file_name not in field_index['las_kids']:
                     raise ValueError(f"No KID found for LAS file {las_file_name}")
 
-                kid = las_entry['KID'].iloc[0]
+                kid = field_index['las_kids'][las_file_name]
                 las_to_kid_map[las_file] = kid
             except ValueError as e:
                 self.log_error(field_folder_name, las_file_name, str(e), "No KID found.")
@@ -290,17 +821,14 @@ class LASFileProcessor:
 
         return las_to_kid_map
 
-    def get_well_information(self, field_name, kid, wells_df, logs_df):
+    def get_well_information(self, field_name, kid, field_index):
         try:
-            well_info = wells_df[wells_df['KID'] == kid]
-            log_info = logs_df[logs_df['KID'] == kid]
+            well_info = field_index['wells'].get(kid)
+            log_info = field_index['logs'].get(kid)
 
-            if well_info.empty or log_info.empty:
+            if well_info is None or log_info is None:
                 raise ValueError("No well or log information found for KID.")
 
-            well_info = well_info.iloc[0]
-            log_info = log_info.iloc[0]
-
             return well_info, log_info
         except KeyError as e:
             self.log_error(field_name, kid, str(e), "Key error when retrieving well or log information.")
@@ -314,67 +842,89 @@ class LASFileProcessor:
 
     def log_error(self, field_name, las_file, error, message):
         """
-        Log errors during the processing of LAS files.
+        Log errors during the processing of LAS files, to the journal of the current process.
+        """
+        las_file_name = os.path.basename(las_file) if isinstance(las_file, str) else str(las_file)
+
+        # Open the journal of this process on its first error
+        if _error_journal['pid'] != os.getpid():
+            os.makedirs(ERROR_JOURNAL_FOLDER, exist_ok=True)
+            journal_path = os.path.join(ERROR_JOURNAL_FOLDER, f"{os.getpid()}.jsonl")
+            _error_journal.update(pid=os.getpid(), file=open(journal_path, 'a', buffering=1), logged=set())
+
+        # Check if the error is already logged by this process
+        entry_key = (field_name, las_file_name, error)
+        if entry_key in _error_journal['logged']:
+            return
+        _error_journal['logged'].add(entry_key)
+
+        # Line buffering flushes every record, nothing is lost if a worker dies
+        _error_journal['file'].write(json.dumps({
+            "Field": field_name,
+            "LASFILE": las_file_name,
+            "Error": error,
+            "Message": message
+        }) + '\n')
+
+    def compact_error_journal(self):
+        """
+        Merges the per-process error journals into the grouped JSON report.
         """
-        error_log_path = os.path.join('../reports', '02_LAS_update_error_report.json')
-        os.makedirs(os.path.dirname(error_log_path), exist_ok=True)
+        # Close the journal of this process, later errors start a new one
+        if _error_journal['file'] is not None:
+            _error_journal['file'].close()
+        _error_journal.update(pid=None, file=None, logged=set())
+
+        if not os.path.isdir(ERROR_JOURNAL_FOLDER):
+            return
 
-        with self.lock:  # Ensure exclusive access to the error log file
-            # Read existing error log
-            if os.path.exists(error_log_path):
-                with open(error_log_path, 'r') as f:
+        # Read existing error log
+        existing_log = {}
+        if os.path.exists(ERROR_REPORT_PATH):
+            with open(ERROR_REPORT_PATH, 'r') as f:
+                try:
+                    existing_log = json.load(f)
+                except json.JSONDecodeError:
+                    existing_log = {}
+
+        seen = {(field_name, entry["LASFILE"], entry["Error"]) for field_name, entries in existing_log.items() for entry in entries}
+
+        # Append the new records of every journal
+        journal_paths = sorted(os.path.join(ERROR_JOURNAL_FOLDER, f) for f in os.listdir(ERROR_JOURNAL_FOLDER) if f.endswith('.jsonl'))
+        for journal_path in journal_paths:
+            with open(journal_path, 'r') as f:
+                for line in f:
                     try:
-                        existing_log = json.load(f)
+                        record = json.loads(line)
                     except json.JSONDecodeError:
-                        existing_log = {}
-            else:
-                existing_log = {}
-
-            # Check if the error is already logged
-            if field_name in existing_log:
-                for entry in existing_log[field_name]:
-                    if entry["LASFILE"] == las_file and entry["Error"] == error:
-                        return
-
-            # Update error log
-            if field_name not in existing_log:
-                existing_log[field_name] = []
-
-            existing_log[field_name].append({
-                "LASFILE": os.path.basename(las_file) if isinstance(las_file, str) else str(las_file),
-                "Error": error,
-                "Message": message
-            })
-
-            # Write updated error log
-            with open(error_log_path, 'w') as f:
-                json.dump(existing_log, f, indent=4)
-
-    def map_kids_to_well_names(self, wells_df):
-        kid_to_well_name = {}
-        for _, row in wells_df.iterrows():
-            lease_name = row['LEASE_NAME'].replace(" ", "_")
-            well_name = row['WELL_NAME'].replace(" ", "_")
-            kid_to_well_name[row['KID']] = f"{lease_name}_{well_name}"
-        return kid_to_well_name
-
-    def get_well_name(self, kid, wells_df):
-        well_row = wells_df[wells_df['KID'] == kid]
-        if well_row.empty:
-            return None
-        lease_name = well_row.iloc[0]['LEASE_NAME'].replace(" ", "_").replace("/", "-").title()
-        well_name = well_row.iloc[0]['WELL_NAME'].replace(" ", "_").replace("/", "-").title()
-        return f"{lease_name}_{well_name}"
-
-    def map_kids_to_las_files(self, las_files, las_df):
+                        continue
+                    entry_key = (record["Field"], record["LASFILE"], record["Error"])
+                    if entry_key in seen:
+                        continue
+                    seen.add(entry_key)
+                    existing_log.setdefault(record["Field"], []).append({
+                        "LASFILE": record["LASFILE"],
+                        "Error": record["Error"],
+                        "Message": record["Message"]
+                    })
+
+        # Write updated error log
+        with open(ERROR_REPORT_PATH, 'w') as f:
+            json.dump(existing_log, f, indent=4)
+
+        for journal_path in journal_paths:
+            os.remove(journal_path)
+        with contextlib.suppress(OSError):
+            os.rmdir(ERROR_JOURNAL_FOLDER)
+
+    def get_well_name(self, kid, field_index):
+        # Names are pre-built by build_field_index
+        return field_index['well_names'].get(kid)
+
+    def map_kids_to_las_files(self, las_to_kid_map):
+        # Files without a KID were already reported by map_las_files_to_kids
         kid_to_las_files_map = {}
-        for las_file in las_files:
-            las_file_name = os.path.basename(las_file)
-            las_entry = las_df[las_df['LASFILE'] == las_file_name]
-            if las_entry.empty:
-                self.log_error("General", las_file_name, "No KID found", "No KID found for LAS file.")
-                continue
-            kid = las_entry['KID'].iloc[0]
+        for las_file, kid in las_to_kid_map.items():
             if kid not in kid_to_las_files_map:
                 kid_to_las_files_map[kid] = []
             kid_to_las_files_map[kid].append(las_file)
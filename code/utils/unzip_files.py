@@ -1,11 +1,164 @@
 import zipfile
 import os
+import json
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Name of the manifest written in the target directory, recording every extracted archive
+UNZIP_MANIFEST_FILENAME = 'unzip_manifest.json'
+
+def load_unzip_manifest(target_dir):
+    """
+    Loads the manifest of archives already extracted into target_dir.
+    Returns an empty dict if there is no manifest or it cannot be read.
+    """
+    manifest_path = os.path.join(target_dir, UNZIP_MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+def save_unzip_manifest(target_dir, manifest):
+    """
+    Writes the unzip manifest atomically so an interrupted run never leaves a broken file.
+    """
+    manifest_path = os.path.join(target_dir, UNZIP_MANIFEST_FILENAME)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+def archive_signature(zip_ref, zip_path):
+    """
+    Builds the manifest record of an archive from its size and central directory.
+
+    The CRC is a CRC32 over the name, CRC and size of every member, so it only needs the
+    central directory and not a full read of the archive.
+
+    Args:
+      zip_ref: Open zipfile.ZipFile of the archive
+      zip_path: Path to the archive
+
+    Returns:
+      dict: {'size', 'crc', 'members'} where members maps each extracted file to its size
+    """
+    crc = 0
+    members = {}
+    for info in zip_ref.infolist():
+        crc = zlib.crc32(f"{info.filename}:{info.CRC}:{info.file_size}".encode(), crc)
+        if not info.is_dir():
+            members[info.filename] = info.file_size
+    return {'size': os.path.getsize(zip_path), 'crc': crc, 'members': members}
+
+def is_extracted(record, extract_folder):
+    """
+    Checks that every member recorded in the manifest is still present with its size.
+    """
+    for name, size in record['members'].items():
+        member_path = os.path.join(extract_folder, name)
+        if not os.path.isfile(member_path) or os.path.getsize(member_path) != size:
+            return False
+    return True
+
+def extract_archive(zip_path, extract_folder):
+    """
+    Extracts one archive into its folder.
+
+    Returns:
+      tuple: (zip_path, manifest record or None, error message or None)
+    """
+    try:
+        os.makedirs(extract_folder, exist_ok=True)
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall(extract_folder)
+            return zip_path, archive_signature(zip_ref, zip_path), None
+    except Exception as e:
+        return zip_path, None, str(e)
+
+def extract_folder_archives(zip_paths, extract_folder):
+    """
+    Extracts every archive of one folder, one after the other. Runs in a worker process.
+
+    Archives sharing a folder may hold the same member names, so they are never extracted by
+    two workers at once.
+
+    Returns:
+      list: (zip_path, manifest record or None, error message or None) for each archive
+    """
+    return [extract_archive(zip_path, extract_folder) for zip_path in zip_paths]
+
+def extract_archives(jobs, target_dir, max_workers=None):
+    """
+    Extracts archives in parallel, skipping those unchanged since the last run.
+
+    An archive is skipped when the manifest in target_dir holds the same size and central
+    directory CRC and all of its members are still on disk with the recorded sizes. Archives are
+    grouped by extract folder and each folder is handled by a single worker.
+
+    Args:
+      jobs: List of (zip path, extract folder) pairs
+      target_dir: Directory holding the unzip manifest
+      max_workers: Number of worker processes, defaults to the number of cores
+
+    Returns:
+      list: (zip path, error message) for every archive that could not be extracted
+    """
+    manifest = load_unzip_manifest(target_dir)
+    pending = defaultdict(list)
+    failures = []
+
+    # Only reading the central directory is needed to know if an archive changed
+    for zip_path, extract_folder in jobs:
+        key = os.path.basename(zip_path)
+        record = manifest.get(key)
+        if record and record.get('folder') == extract_folder:
+            try:
+                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                    signature = archive_signature(zip_ref, zip_path)
+                if signature['size'] == record['size'] and signature['crc'] == record['crc'] and is_extracted(record, extract_folder):
+                    continue
+            except zipfile.BadZipFile:
+                pass
+        pending[extract_folder].append(zip_path)
+
+    if not pending:
+        return failures
+
+    # Extract the changed archives in parallel, one folder per task
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(extract_folder_archives, zip_paths, extract_folder): extract_folder for extract_folder, zip_paths in pending.items()}
+        for future in as_completed(futures):
+            extract_folder = futures[future]
+
+            # A crashed worker fails every archive of its folder
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [(zip_path, None, str(e)) for zip_path in pending[extract_folder]]
+
+            for zip_path, record, error in results:
+                key = os.path.basename(zip_path)
+                if error:
+                    failures.append((zip_path, error))
+                    manifest.pop(key, None)
+                    continue
+                record['folder'] = extract_folder
+                manifest[key] = record
+
+    save_unzip_manifest(target_dir, manifest)
+    return failures
 
 def unzip_files_KGS(source_dir, target_dir):
     """
     This function unzips files from a source directory to a target directory.
     Each zip file will be unzipped into a subdirectory named after the zip file.
     the information is gotteng from the KGS website.
+    Archives are extracted in parallel and archives unchanged since the last run are skipped.
+    Returns the (zip path, error message) pairs of the archives that could not be extracted.
     """
     # Check if target directory exists, if not create it
     if not os.path.exists(target_dir):
@@ -17,9 +170,10 @@ def unzip_files_KGS(source_dir, target_dir):
     # Check if there are any .zip files in the directory
     if not zip_files:
         print("No .zip files found in the source directory.")
-        return
+        return []
 
     # Iterate over each file
+    jobs = []
     for file in zip_files:
         # Construct full file path
         file_name = os.path.join(source_dir, file)
@@ -29,14 +183,14 @@ def unzip_files_KGS(source_dir, target_dir):
         formatted_field_name = format_field_name(field_name)
         field_dir = os.path.join(target_dir, formatted_field_name)
 
-        # Create a directory for the field if it doesn't exist
-        if not os.path.exists(field_dir):
-            os.makedirs(field_dir)
+        # Extract all the contents of the zip file into the field-specific directory
+        jobs.append((file_name, field_dir))
 
-        # Create a ZipFile object
-        with zipfile.ZipFile(file_name, 'r') as zip_ref:
-            # Extract all the contents of the zip file into the field-specific directory
-            zip_ref.extractall(field_dir)
+    # Report the archives that could not be extracted
+    failures = extract_archives(jobs, target_dir)
+    for zip_path, error in failures:
+        print(f"Error extracting {zip_path}: {error}")
+    return failures
 
 # def unzip_files(source_folder, destination_folder):
 #     """
@@ -96,12 +250,18 @@ def unzip_files(source_folder, destination_folder):
     Args:
       source_folder: Path to folder containing subfolders with .zip files
       destination_folder: Path to folder where contents of .zip files will be extracted
+
+    Returns:
+      list: (zip path, error message) for every archive that could not be extracted
+
+    Archives are extracted in parallel and archives unchanged since the last run are skipped.
     """
     # Check if destination folder exists and create it if not
     if not os.path.exists(destination_folder):
         os.makedirs(destination_folder, exist_ok=True)
     
     # Iterate through each file in the source directory
+    jobs = []
     for filename in os.listdir(source_folder):
         if filename.endswith('.zip'):
             zipfile_path = os.path.join(source_folder, filename)
@@ -110,10 +270,13 @@ def unzip_files(source_folder, destination_folder):
             formatted_field_name = format_field_name(field_name)
             extract_folder = os.path.join(destination_folder, formatted_field_name)
             
-            os.makedirs(extract_folder, exist_ok=True)
-            
-            with zipfile.ZipFile(zipfile_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_folder)
+            jobs.append((zipfile_path, extract_folder))
+
+    # Report the archives that could not be extracted
+    failures = extract_archives(jobs, destination_folder)
+    for zip_path, error in failures:
+        print(f"Error extracting {zip_path}: {error}")
+    return failures
 
 ### FORMAT RAW DATA FOLDER ###
 # import os
@@ -8,6 +8,7 @@ import matplotlib.colors as mcolors
 from striplog import Striplog, Legend, Component, Interval
 import warnings
 import os
+from src.project_manager import WellLoadError
 
 # Define default plot settings for well logging tracks with color palettes and track widths
 default_plot_settings = {
@@ -82,7 +83,7 @@ def well_plots_ui(project_manager):
     
     # Well Selector
     well_selector = widgets.SelectMultiple(
-        options=sorted([well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] for well in project_manager.project]),
+        options=sorted(project_manager.get_lease_names()),
         disabled=False,
         rows=15,
         layout=widgets.Layout(width='auto', flex='1 1 auto')
@@ -228,7 +229,7 @@ def well_plots_ui(project_manager):
 
     def save_plot_for_well(well_name, project_manager, config):
         try:
-            well = next(well for well in project_manager.project if well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] == well_name)
+            well = project_manager.get_well(well_name)
             fig = plot_well(well, project_manager, config)
             if fig:
                 # Create the directory if it doesn't exist
@@ -385,8 +386,12 @@ def plot_selected_wells(change, well_selector, plot_area, project_manager, confi
     with plot_area:
         plot_area.clear_output(wait=True)
         for well_name in selected_wells:
-            well = next(well for well in project_manager.project if well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] == well_name)
-            fig = plot_well(well, project_manager, config)
+            try:
+                well = project_manager.get_well(well_name)
+                fig = plot_well(well, project_manager, config)
+            except WellLoadError as e:
+                print(f"Skipping well '{well_name}': {e}")
+                continue
             if fig:
                 display(fig)
                 plt.close(fig)
@@ -486,7 +491,7 @@ def plot_well(well, project_manager, config):
     axes[0].set_yticks(y_ticks)
     axes[0].set_yticklabels([f'{tick:.0f}' for tick in y_ticks])
 
-    well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+    well_name = project_manager.get_lease_name(well)
     # Add well name as a big title
     fig.suptitle(f"{well_name}", fontsize=16, fontweight='bold', y=0.95, color='black')
     
@@ -496,7 +501,7 @@ def plot_well(well, project_manager, config):
     return fig
 
 def plot_formation_data(ax, well, project_manager, min_depth, max_depth):
-    well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+    well_name = project_manager.get_lease_name(well)
     formation_data = project_manager.formation_data.get(well_name, [])
     
     if not formation_data:
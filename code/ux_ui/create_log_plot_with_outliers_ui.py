@@ -7,6 +7,7 @@ import numpy as np
 import matplotlib.colors as mcolors
 import warnings
 import os
+from src.project_manager import WellLoadError
 
 # Define default plot settings for well logging tracks with color palettes and track widths
 default_plot_settings = {
@@ -79,7 +80,7 @@ def well_plots_ui(project_manager):
     # Well Selector
     well_label = widgets.HTML("<b>Select Wells:</b>")
     well_selector = widgets.SelectMultiple(
-        options=sorted([well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] for well in project_manager.project]),
+        options=sorted(project_manager.get_lease_names()),
         disabled=False,
         rows=15,
         layout=widgets.Layout(width='auto', flex='1 1 auto')
@@ -260,7 +261,7 @@ def well_plots_ui(project_manager):
             for well_name in well_selector.options:
                 try:
                     # Retrieve the well object
-                    well = next(well for well in project_manager.project if well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] == well_name)
+                    well = project_manager.get_well(well_name)
                     
                     # Generate plots
                     figs = plot_well(well, project_manager, config, selected_tracks_for_outliers=selected_tracks)
@@ -293,7 +294,7 @@ def well_plots_ui(project_manager):
     def save_plot_for_well(well_name, project_manager, config, selected_tracks):
         try:
             # Retrieve the well object
-            well = next(well for well in project_manager.project if well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] == well_name)
+            well = project_manager.get_well(well_name)
             
             # Generate plots
             figs = plot_well(well, project_manager, config, selected_tracks_for_outliers=selected_tracks)
@@ -509,15 +510,19 @@ def plot_selected_wells(change, well_selector, plot_area, project_manager, confi
         for well_name in selected_wells:
             try:
                 # Retrieve the well object
-                well = next(well for well in project_manager.project if well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] == well_name)
-            except StopIteration:
+                well = project_manager.get_well(well_name)
+            except KeyError:
                 print(f"Well '{well_name}' not found in the project. Available wells:")
                 for well in project_manager.project:
-                    print(f"- {well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]}")
+                    print(f"- {project_manager.get_lease_name(well)}")
                 continue
 
-            # Generate plots
-            figs = plot_well(well, project_manager, config, selected_tracks_for_outliers=selected_tracks)
+            # Generate plots, skipping wells whose curves cannot be loaded
+            try:
+                figs = plot_well(well, project_manager, config, selected_tracks_for_outliers=selected_tracks)
+            except WellLoadError as e:
+                print(f"Skipping well '{well_name}': {e}")
+                continue
             
             if figs:
                 for fig, method in figs:
@@ -544,13 +549,13 @@ def plot_well(well, project_manager, config, selected_tracks_for_outliers=None):
     standardized_curve_mapping = project_manager.standardized_curve_mapping
 
     if not selected_tracks_for_outliers:
-        print(f"No tracks selected for outlier plotting for well: {well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]}")
+        print(f"No tracks selected for outlier plotting for well: {project_manager.get_lease_name(well)}")
         return None
 
     methods = list(outliers.keys())
 
     if len(methods) == 0:
-        print(f"No outlier detection methods available for well: {well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]}")
+        print(f"No outlier detection methods available for well: {project_manager.get_lease_name(well)}")
         return None
 
     # Prepare the list of selected tracks to plot outliers for
@@ -565,7 +570,7 @@ def plot_well(well, project_manager, config, selected_tracks_for_outliers=None):
 
         curves = [curve for curve in standardized_curve_mapping[track_name] if curve in well.data.keys()]
         if not curves:
-            print(f"No valid curves to plot for track '{track_name}' in well '{well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]}'.")
+            print(f"No valid curves to plot for track '{track_name}' in well '{project_manager.get_lease_name(well)}'.")
             continue
 
         # Find the overall depth range for the selected track
@@ -587,7 +592,7 @@ def plot_well(well, project_manager, config, selected_tracks_for_outliers=None):
 
         for ax, method in zip(axes, methods):
             method_outliers = outliers.get(method, {})
-            well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+            well_name = project_manager.get_lease_name(well)
             method_specific_outliers = method_outliers.get(well_name, {})
 
             plot_log_track_with_outliers(ax, well, track_name, curves, config[track_name],
@@ -612,7 +617,7 @@ def plot_well(well, project_manager, config, selected_tracks_for_outliers=None):
         axes[0].set_yticks(y_ticks)
         axes[0].set_yticklabels([f'{tick:.0f}' for tick in y_ticks])
 
-        well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+        well_name = project_manager.get_lease_name(well)
         # Add well name and track as a big title
         fig.suptitle(f"{well_name} - {track_name} Outliers", fontsize=16, fontweight='bold', y=0.95, color='black')
 
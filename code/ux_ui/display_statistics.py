@@ -19,7 +19,7 @@ def display_statistics(project_manager):
 
     # Dropdown for selecting wells using lease names
     wells_label = widgets.Label('Select Wells:')
-    lease_names = [well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] for well in project_manager.project]
+    lease_names = project_manager.get_lease_names()
     well_selector = widgets.SelectMultiple(
         options=lease_names,
         disabled=False,
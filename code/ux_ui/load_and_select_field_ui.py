@@ -19,9 +19,18 @@ class SuppressOutput:
         sys.stderr = self.original_stderr
 
 def load_and_select_field_ui(project_manager):
+    # Label the fields with their size when the LAS catalog exists
+    field_options = project_manager.load_fields()
+    if project_manager.has_catalog():
+        summary = {row.field: row for row in project_manager.get_field_summary().itertuples()}
+        field_options = [
+            (f"{field} ({summary[field].wells} wells, {summary[field].size_mb:.0f} MB)", field) if field in summary else (field, field)
+            for field in field_options
+        ]
+
     # Create a dropdown widget for field selection
     field_selector = widgets.Dropdown(
-        options=project_manager.load_fields(),
+        options=field_options,
         description='Fields:',
         disabled=False,
         layout=widgets.Layout(width='auto')
@@ -65,6 +74,11 @@ def load_and_select_field_ui(project_manager):
                 with SuppressOutput():
                     project_manager.load_selected_field(progress_callback)
 
+                if project_manager.load_errors:
+                    print(f"Skipped {len(project_manager.load_errors)} LAS files that failed to load:")
+                    for las_file, error in project_manager.load_errors.items():
+                        print(f"  {os.path.basename(las_file)}: {error}")
+
                 # print(f"Loaded {len(project_manager.project)} wells in {project_manager.selected_field}.")
             except Exception as e:
                 print(f"Error loading wells: {e}")
@@ -20,6 +20,7 @@ from scipy.cluster.hierarchy import dendrogram, linkage
 
 import ipywidgets as widgets
 from IPython.display import display, clear_output
+from utils.field_store import read_curve_slice
 
 def plot_bar(combined_data, selected_wells, save_path=None):
     msno.bar(combined_data, figsize=(13, 8), fontsize=10)
@@ -132,9 +133,13 @@ def update_plots(well_selector, tabs, project_manager, save_button):
     if not selected_wells:
         return
 
+    # Release the data of the previous selection before building the new one
+    save_button.combined_data = None
+    project_manager.register_component('missingno', None)
+
     well_data = []
-    for well in project_manager.project:
-        well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+    for well in project_manager.loaded_wells(selected_wells):
+        well_name = project_manager.get_lease_name(well)
         if well_name in selected_wells:
             curves_dict = {mnemonic: curve.values for mnemonic, curve in well.data.items() if mnemonic in selected_curves}
             df = pd.DataFrame(curves_dict)
@@ -177,6 +182,7 @@ def update_plots(well_selector, tabs, project_manager, save_button):
 
     save_button.combined_data = combined_data
     save_button.selected_wells = selected_wells
+    project_manager.register_component('missingno', combined_data)
 
 def save_plot(save_button, tabs, project_manager, well_selector, combined_data):
     if combined_data is None or combined_data.empty:
@@ -215,8 +221,18 @@ def save_plot(save_button, tabs, project_manager, well_selector, combined_data):
 def generate_plots_for_well(well, selected_curves, base_save_directory):
     well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
     curves_dict = {mnemonic: curve.values for mnemonic, curve in well.data.items() if mnemonic in selected_curves}
-    combined_data = pd.DataFrame(curves_dict)
+    return save_well_plots(well_name, pd.DataFrame(curves_dict), selected_curves, base_save_directory)
+
+def generate_plots_for_stored_well(well_name, curve_slices, selected_curves, base_save_directory):
+    # The worker receives where its curves lie in the field store and reads them from its shared pages
+    curves_dict = {curve: read_curve_slice(curve_slice) for curve, curve_slice in curve_slices.items()}
+    return save_well_plots(well_name, pd.DataFrame(curves_dict), selected_curves, base_save_directory)
 
+def stored_well_curve_slices(field_store, well_name, selected_curves):
+    # Only the selected curves of the well, not the offset table of the whole field
+    return {curve: field_store.curve_slice(well_name, curve) for curve in field_store.curves(well_name) if curve in selected_curves}
+
+def save_well_plots(well_name, combined_data, selected_curves, base_save_directory):
     if combined_data.empty:
         return f"No valid data found for well: {well_name}"
 
@@ -246,7 +262,7 @@ def generate_report(project_manager, progress_bar):
     base_save_directory = os.path.join(os.getcwd(), 'plots', 'Well_plots')
     os.makedirs(base_save_directory, exist_ok=True)
 
-    total_wells = len(project_manager.project)
+    total_wells = len(project_manager.field_store.wells) if project_manager.field_store is not None else len(project_manager.project)
     progress_bar.max = total_wells
 
     plt.style.use('seaborn-v0_8-colorblind')
@@ -256,7 +272,13 @@ def generate_report(project_manager, progress_bar):
 
     # Using ProcessPoolExecutor to manage parallel processing
     with ProcessPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(generate_plots_for_well, well, project_manager.selected_curves, base_save_directory) for well in project_manager.project]
+        if project_manager.field_store is not None:
+            futures = [
+                executor.submit(generate_plots_for_stored_well, well_name, stored_well_curve_slices(project_manager.field_store, well_name, project_manager.selected_curves), project_manager.selected_curves, base_save_directory)
+                for well_name in project_manager.field_store.wells
+            ]
+        else:
+            futures = [executor.submit(generate_plots_for_well, well, project_manager.selected_curves, base_save_directory) for well in project_manager.loaded_wells()]
 
         for future in futures:
             result = future.result()
@@ -269,7 +291,7 @@ def create_missing_data_ui(project_manager):
     title_label = widgets.HTML(value="<h2 style='text-align:center; background-color:lightblue; padding:10px;'>Missing Data Analysis</h2>")
     wells_label = widgets.Label('Select Wells:')
     well_selector = widgets.SelectMultiple(
-        options=[well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] for well in project_manager.project],
+        options=project_manager.get_lease_names(),
         disabled=False,
         rows=15,
         layout=widgets.Layout(width='auto')
@@ -154,8 +154,8 @@ def save_plot(curve_selector, well_selector, tabs, project_manager):
     # Collect data for selected wells
     data = {}
     well_names = []
-    for well in project_manager.project:
-        well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+    for well in project_manager.loaded_wells(selected_wells):
+        well_name = project_manager.get_lease_name(well)
         if well_name in selected_wells and selected_curve in well.data:
             data[well_name] = well.data[selected_curve].values
             well_names.append(well_name)
@@ -193,8 +193,8 @@ def generate_report(curve_selector, well_selector, project_manager):
         curve_directory = os.path.join(base_directory, selected_curve)
         os.makedirs(curve_directory, exist_ok=True)
 
-        for well in project_manager.project:
-            well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+        for well in project_manager.loaded_wells():
+            well_name = project_manager.get_lease_name(well)
             if selected_curve in well.data:
                 data = {well_name: well.data[selected_curve].values}
                 
@@ -273,7 +273,7 @@ def create_statistics_plots_by_curve_ui(project_manager):
     def update_curves_and_wells(*args):
         if curve_selector.value:
             selected_curve = curve_selector.value[0]
-            wells_with_curve = [well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0] 
+            wells_with_curve = [project_manager.get_lease_name(well) 
                                 for well in project_manager.project if selected_curve in well.data]
             well_selector.options = wells_with_curve
         else:
@@ -291,8 +291,8 @@ def create_statistics_plots_by_curve_ui(project_manager):
         data = {}
         well_names = []
         depths = {}
-        for well in project_manager.project:
-            well_name = well.header.loc[well.header['mnemonic'] == 'LEASE', 'value'].values[0]
+        for well in project_manager.loaded_wells(selected_wells):
+            well_name = project_manager.get_lease_name(well)
             if well_name in selected_wells and selected_curve in well.data:
                 data[well_name] = well.data[selected_curve].values
                 if 'DEPTH' in well.data:
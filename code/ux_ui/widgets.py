@@ -68,7 +68,7 @@ def logs_plot(project_manager, target_dir, log_config):
     os.makedirs(target_dir, exist_ok=True)
 
     # Iterate over wells in the project
-    for well in tqdm(project_manager.project, desc="Processing Wells"):
+    for well in tqdm(project_manager.loaded_wells(), total=len(project_manager.project), desc="Processing Wells"):
         df = well.df()  # Convert well data to DataFrame
         well_name = well.name
         depth = df.index.values